@@ -3,10 +3,14 @@ from fastapi import APIRouter
 from app.apis.v1 import route_login
 from app.apis.v1 import route_user
 from app.apis.v1 import route_member
+from app.apis.v1 import route_wellknown
+from app.apis.v1 import route_health
 
 
 api_router = APIRouter()
 
 api_router.include_router(route_login.router, prefix="/auth", tags=["Login"])
 api_router.include_router(route_user.router, prefix="/users", tags=["Users"])
-api_router.include_router(route_member.router, prefix="/members", tags=["Members"])
\ No newline at end of file
+api_router.include_router(route_member.router, prefix="/members", tags=["Members"])
+api_router.include_router(route_wellknown.router, prefix="/.well-known", tags=["Well-Known"])
+api_router.include_router(route_health.router, prefix="/health", tags=["Health"])
\ No newline at end of file
@@ -0,0 +1,57 @@
+# Built-in Dependencies
+from typing import Optional
+
+# Third-Party Dependencies
+from fastapi import HTTPException
+from fastapi.security.utils import get_authorization_scheme_param
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Local Dependencies
+from app.core.cache import principal_cache, token_digest
+from app.core.dependencies import get_current_user
+from app.db.session import local_session
+
+UNAUTHORIZED_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _extract_token(request: Request) -> Optional[str]:
+    # The gateway forwards either the browser cookie or an Authorization header
+    authorization = request.headers.get("authorization") or request.cookies.get("access_token")
+    scheme, param = get_authorization_scheme_param(authorization)
+    if not authorization or scheme.lower() != "bearer" or not param:
+        return None
+    return param
+
+
+async def verify_request(request: Request) -> Response:
+    """Forward-auth endpoint for ``auth_request``-style gateways.
+
+    Served as a plain Starlette route (no FastAPI dependencies, no Pydantic
+    models): 200 with identity headers when the token is valid, 401 otherwise,
+    always with an empty body.
+    """
+    token = _extract_token(request)
+    if token is None:
+        return Response(status_code=401, headers=UNAUTHORIZED_HEADERS)
+
+    principal = principal_cache.get(token_digest(token))
+    if principal is not None:
+        user = principal.to_dict()
+    else:
+        # Cold path: the regular verification, which also warms the cache
+        async with local_session() as db:
+            try:
+                user = await get_current_user(token=token, db=db)
+            except HTTPException:
+                return Response(status_code=401, headers=UNAUTHORIZED_HEADERS)
+
+    headers = {
+        "X-User-Id": str(user["id"]),
+        "X-User-Email": user["email"],
+        "X-User-Role": str(int(user["user_role"])),
+    }
+    if user.get("org_id"):
+        headers["X-Org-Id"] = str(user["org_id"])
+
+    return Response(status_code=200, headers=headers)
@@ -0,0 +1,56 @@
+# Built-in Dependencies
+from typing import Tuple
+import asyncio
+import time
+
+# Third-Party Dependencies
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+# Local Dependencies
+from app.core.dependencies import ServiceClient
+from app.db.session import async_engine
+from app.db.pool import pool_metrics
+from app.db.replicas import replica_router
+
+
+router = APIRouter(tags=["Health"])
+
+
+async def _ping() -> None:
+    async with async_engine.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1")
+
+
+async def _check() -> Tuple[int, str, float]:
+    # Round trip through the pool, so a saturated pool shows up as latency
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(_ping(), timeout=5)
+        status_code, status = 200, "ok"
+    except Exception as e:
+        status_code, status = 503, f"unavailable: {type(e).__name__}"
+    return status_code, status, (time.perf_counter() - start) * 1000
+
+
+@router.get("/db")
+async def get_db_health() -> JSONResponse:
+    # Public probe: status only, no pool internals or replica names
+    status_code, status, _ = await _check()
+    return JSONResponse(
+        status_code=status_code, content={"status": "ok" if status_code == 200 else "unavailable"}
+    )
+
+
+@router.get("/db/metrics")
+async def get_db_metrics(_client: ServiceClient) -> JSONResponse:
+    status_code, status, latency_ms = await _check()
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "status": status,
+            "latency_ms": latency_ms,
+            "pool": pool_metrics.stats(async_engine.pool),
+            "replicas": replica_router.stats(),
+        },
+    )
@@ -1,5 +1,5 @@
 # Built-in Dependencies
-from typing import Annotated, Dict
+from typing import Annotated, Any, Dict
 from datetime import timedelta
 
 # Third-party Dependencies
@@ -10,21 +10,28 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 # Local Dependencies
-from app.core.http_exceptions import UnauthorizedException
+from app.core.http_exceptions import UnauthorizedException, BadRequestException
 from app.core.config import settings
-from app.db.schemas.v1.schema_auth import Token
-from app.db.session import async_get_db
+from app.db.schemas.v1.schema_auth import (
+    Token,
+    TokenIntrospection,
+    TokenIntrospectionBatch,
+    TokenIntrospectionBatchResult,
+)
+from app.db.session import async_get_db, async_get_read_db
 from app.core.security import (
     create_access_token,
+    build_token_claims,
     authenticate_user,
     create_refresh_token,
     verify_token,
+    verify_tokens,
     oauth2_scheme,
     blacklist_token,
 )
-from app.db.crud.crud_user import crud_users
+from app.db.crud.crud_user import crud_users, revoke_user_sessions
 from app.core.hashing import Hasher
-from app.core.dependencies import CurrentUser
+from app.core.dependencies import CurrentUser, ServiceClient
 from app.db.schemas.v1.schema_user import UserPasswordReset
 from app.db.models.auth import LoginInput
 
@@ -45,11 +52,15 @@ async def login_for_access_token(
         raise UnauthorizedException("Wrong email or password.")
 
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    token_claims = {"sub": user["email"], "ver": user["token_version"]}
+    rich_claims = None
+    if settings.RICH_CLAIMS_TOKENS:
+        rich_claims = await build_token_claims(user=user, db=db)
     access_token = await create_access_token(
-        data={"sub": user["email"]}, expires_delta=access_token_expires
+        data=token_claims, expires_delta=access_token_expires, rich_claims=rich_claims
     )
 
-    refresh_token = await create_refresh_token(data={"sub": user["email"]})
+    refresh_token = await create_refresh_token(data=token_claims)
     max_age = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
     response.set_cookie(
@@ -84,12 +95,42 @@ async def refresh_access_token(
     if not user_data:
         raise UnauthorizedException("Invalid refresh token.")
 
+    rich_claims = None
+    if settings.RICH_CLAIMS_TOKENS:
+        user = await crud_users.get(
+            db=db, schema_to_select="principal", email=user_data.email, is_deleted=False
+        )
+        if not user:
+            raise UnauthorizedException("Invalid refresh token.")
+        rich_claims = await build_token_claims(user=user, db=db)
+
     new_access_token = await create_access_token(
-        data={"sub": user_data.username_or_email}
+        data={"sub": user_data.email, "ver": user_data.ver}, rich_claims=rich_claims
     )
     return {"access_token": new_access_token, "token_type": "bearer"}
 
 
+@router.post("/introspect/batch", response_model=TokenIntrospectionBatchResult)
+async def introspect_tokens(
+    batch: TokenIntrospectionBatch,
+    # Resource servers only, as in RFC 7662: each token costs a signature check
+    _client: ServiceClient,
+    db: AsyncSession = Depends(async_get_read_db),
+) -> Dict[str, Any]:
+    if len(batch.tokens) > settings.INTROSPECTION_MAX_BATCH:
+        raise BadRequestException(
+            f"At most {settings.INTROSPECTION_MAX_BATCH} tokens per request."
+        )
+
+    token_data = await verify_tokens(batch.tokens, db)
+    return {
+        "results": [
+            TokenIntrospection(active=data is not None, claims=data)
+            for data in token_data
+        ]
+    }
+
+
 @router.post("/logout")
 async def logout(
     response: Response,
@@ -112,16 +153,21 @@ async def change_password(
     current_user: CurrentUser,
     db: AsyncSession = Depends(async_get_db),
 ):
-    db_user = await crud_users.get(db=db, email=current_user["email"])
+    db_user = await crud_users.get(
+        db=db, schema_to_select="login", email=current_user["email"]
+    )
     
     if not db_user:
         raise UnauthorizedException("User not found.")
     
-    if not Hasher.verify_password(password_change.current_password, db_user["hashed_password"]):
+    if not await Hasher.averify_password(password_change.current_password, db_user["hashed_password"]):
         raise UnauthorizedException("Current password is incorrect.")
     
-    hashed_new_password = Hasher.get_hash_password(password_change.new_password)
+    hashed_new_password = await Hasher.aget_hash_password(password_change.new_password)
     
-    await crud_users.update(db=db, id=db_user["id"], object={"hashed_password": hashed_new_password})
+    # Changing the password signs the user out of every existing session
+    await revoke_user_sessions(
+        db=db, object={"hashed_password": hashed_new_password}, id=db_user["id"]
+    )
     
     return {"message": "Password changed successfully."}
\ No newline at end of file
@@ -7,7 +7,7 @@ from app.db.crud.crud_member import crud_member, create_new_member
 from app.db.crud.crud_organization import crud_organization
 from app.db.schemas.v1.schema_member import MemberCreate
 from app.core.dependencies import async_get_db
-from app.core.dependencies import CurrentUser
+from app.core.dependencies import CurrentUser, CurrentClaims, require_owner
 from fastapi import Depends, Request
 from typing import Annotated, Dict
 from app.core.http_exceptions import (
@@ -22,16 +22,16 @@ router = APIRouter(tags=["Members"])
 @router.post("/invite-member")
 async def invite_member(
     member_data: MemberCreate,
-    current_user: CurrentUser,
+    current_claims: CurrentClaims,
     db: AsyncSession = Depends(async_get_db)
 ):
-    if current_user["user_role"] != 100:
-        raise HTTPException(status_code=403, detail="Not authorized to invite members.")
-    
     org = await crud_organization.get(db=db, id=member_data.org_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found.")
 
+    # Owners may only invite into the organization they own
+    await require_owner(current_claims, member_data.org_id, db)
+
     await create_new_member(member_data, db)
     
     return {"message": "Member invited successfully."}
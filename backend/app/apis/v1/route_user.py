@@ -1,27 +1,20 @@
 # Built-in Dependencies
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
+from uuid import UUID
 
 # Third-Party Dependencies
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import Depends, Request
 import fastapi
 from sqlalchemy import select
-from sqlmodel import update
 
 # Local Dependencies
-from app.db.crud.crud_user import crud_users, create_new_user
-from app.db.crud.crud_organization import crud_organization, create_new_organization
-from app.db.crud.crud_role import crud_role, create_new_role, get_role
-from app.db.crud.crud_member import crud_member, create_new_member
-from app.db.session import async_get_db
+from app.db.crud.crud_user import crud_users, revoke_user_sessions
+from app.db.crud.crud_signup import create_new_signup
+from app.db.crud.crud_counter import get_role_counts
+from app.db.session import async_get_db, async_get_read_db
 from app.core.http_exceptions import HTTPException
-from app.db.schemas.v1.schema_user import UserCreate
-from app.db.schemas.v1.schema_organization import OrganizationCreate
-from app.db.schemas.v1.schema_role import RoleCreate
-from app.db.schemas.v1.schema_member import (
-    MemberCreate,
-    MemberRead,
-)
+from app.db.schemas.v1.schema_member import MemberRead
 from app.db.schemas.v1.schema_auth import SignUpCreate
 from app.db.models.user import AccessLevelBase, User
 
@@ -34,61 +27,24 @@ async def signUp(
     signUp_data: SignUpCreate,
     db: Annotated[AsyncSession, Depends(async_get_db)],
 ) -> Any:
-    user_in = UserCreate(
-        email=signUp_data.email,
-        userProfile=signUp_data.userProfile,
-        userStatus=signUp_data.userStatus,
-        userSettings=signUp_data.userSettings,
-        password=signUp_data.password,
-        user_role=signUp_data.user_role
-    )
-    user = await create_new_user(user_in, db)
-
-    # Create organization entry
-    organization_in = OrganizationCreate(
-        organizationName=signUp_data.organizationName,
-        organizationStatus=signUp_data.organizationStatus,
-        organizationPersonal=signUp_data.organizationPersonal,
-        organizationSettings=signUp_data.organizationSettings,
-    )
-
-    # Create organization and associate with the user
-    organization = await create_new_organization(organization_in, db)
+    # User, organization, owner role and member are created in one statement
+    return await create_new_signup(signUp_data, db)
 
-    # Add member entry with 'owner' role
-    # Ensure the 'owner' role exists or create it
-    owner_role = await get_role(roleName="owner", db=db)
-    
-    if not owner_role:
-        role_data = RoleCreate(
-            roleName="owner",
-            roleDescription="Owner of the Organization",
-            org_id=organization.id
-            )
-        owner_role = await create_new_role(role_data, db)
-
-    # Create member entry and assign 'owner' role to the user
-    member_in = MemberCreate(
-        user_id=user.id,
-        org_id=organization.id,
-        role_id=owner_role['id'],
-        memberName=signUp_data.memberName,
-        memberStatus=signUp_data.memberStatus
+@router.get("/count-by-role")
+async def get_users_count_by_role(
+    role: Optional[AccessLevelBase] = None,
+    org_id: Optional[UUID] = None,
+    db: AsyncSession = Depends(async_get_read_db),
+):
+    # Counts active users (or active members of ``org_id``); all roles when no role is given
+    counts = await get_role_counts(
+        db=db, org_id=org_id, user_role=role.value if role is not None else None
     )
 
-    return await create_new_member(member_in, db)
+    if role is not None:
+        return {"role": role.name, "count": counts.get(role.value, 0)}
 
-@router.get("/count-by-role")
-async def get_users_count_by_role(role: AccessLevelBase, db: AsyncSession = Depends(async_get_db)):
-    if role not in AccessLevelBase:
-        raise HTTPException(status_code=400, detail="Invalid role")
-    
-    result = await db.exec(select(User).where(User.user_role == role.value))
-    
-    users_with_role = result.all()
-    user_count = len(users_with_role)
-    
-    return {"role": role.name, "count": user_count}
+    return {"counts": {level.name: counts.get(level.value, 0) for level in AccessLevelBase}}
 
 @router.patch("/change-role", status_code=200)
 async def change_user_role(
@@ -114,14 +70,9 @@ async def change_user_role(
             detail="Invalid role"
         )
 
-    # Update the user's role
-    stmt = (
-        update(User)
-        .where(User.email == user_email)
-        .values(user_role=new_role.value)
-        .execution_options(synchronize_session="fetch")
+    # Update the user's role, revoking tokens issued under the old one
+    await revoke_user_sessions(
+        db=db, object={"user_role": new_role.value}, email=user_email
     )
-    await db.execute(stmt)
-    await db.commit()
 
     return {"message": f"User role updated to {new_role.name}"}
\ No newline at end of file
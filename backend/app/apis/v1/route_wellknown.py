@@ -0,0 +1,27 @@
+# Built-in Dependencies
+import hashlib
+
+# Third-Party Dependencies
+from fastapi import APIRouter, Request, Response
+
+# Local Dependencies
+from app.core.config import settings
+from app.core.keys import key_ring
+
+
+router = APIRouter(tags=["Well-Known"])
+
+
+@router.get("/jwks.json")
+async def get_jwks(request: Request) -> Response:
+    body = key_ring.jwks()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}",
+        "ETag": etag,
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
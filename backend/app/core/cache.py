@@ -0,0 +1,308 @@
+# Built-in Dependencies
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+from collections import OrderedDict
+import hashlib
+import time
+
+# Local Dependencies
+from app.core.config import settings
+
+ValueType = TypeVar("ValueType")
+
+
+def token_digest(token: str) -> str:
+    # Compact, fixed-width key so raw tokens are never kept in memory
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _as_list(value: Any) -> List[Any]:
+    # Bulk CRUD writes pass list filters (IN (...)) to listeners
+    return list(value) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+
+
+def _user_keys(filters: Dict[str, Any]) -> List[str]:
+    return [
+        str(value)
+        for key in ("id", "email") if key in filters
+        for value in _as_list(filters[key])
+    ]
+
+
+class TTLCache(Generic[ValueType]):
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Each entry may carry its own deadline (e.g. the token expiry), which is
+    capped by the cache-wide ``ttl``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, ValueType]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable) -> Optional[ValueType]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        deadline, value = entry
+        if deadline <= self._timer():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: ValueType, ttl: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        self._data[key] = (self._timer() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[ValueType]:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def items(self) -> List[Tuple[Hashable, ValueType]]:
+        now = self._timer()
+        return [
+            (key, value) for key, (deadline, value) in self._data.items() if deadline > now
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class PrincipalSnapshot:
+    """Compact view of an authenticated user, as returned by ``get_current_user``."""
+
+    __slots__ = ("id", "email", "user_role", "userStatus", "org_id")
+
+    def __init__(
+        self,
+        id: Any,
+        email: str,
+        user_role: int,
+        userStatus: int = 0,
+        org_id: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.email = email
+        self.user_role = user_role
+        self.userStatus = userStatus
+        self.org_id = org_id
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "PrincipalSnapshot":
+        return cls(**{name: row[name] for name in cls.__slots__ if name in row})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PrincipalCache:
+    """Token digest -> ``PrincipalSnapshot`` cache with per-user invalidation."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: TTLCache[PrincipalSnapshot] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._by_user: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str) -> Optional[PrincipalSnapshot]:
+        return self._entries.get(digest)
+
+    def set(self, digest: str, principal: PrincipalSnapshot, ttl: Optional[float] = None) -> None:
+        self._entries.set(digest, principal, ttl=ttl)
+        if len(self._by_user) > 2 * self._entries.maxsize:
+            self._rebuild_index()
+        for user_key in (str(principal.id), principal.email):
+            self._by_user.setdefault(user_key, set()).add(digest)
+
+    def invalidate_token(self, token: str) -> None:
+        self.invalidate_digest(token_digest(token))
+
+    def invalidate_digest(self, digest: str) -> None:
+        self._entries.pop(digest)
+
+    def invalidate_user(self, **filters: Any) -> None:
+        # Writes filtered by anything other than the user identity may touch
+        # any number of users, so drop everything in that case
+        user_keys = _user_keys(filters)
+        if not user_keys:
+            self.clear()
+            return
+
+        for user_key in user_keys:
+            for digest in self._by_user.pop(user_key, set()):
+                principal = self._entries.pop(digest)
+                if principal is not None:
+                    self._by_user.get(str(principal.id), set()).discard(digest)
+                    self._by_user.get(principal.email, set()).discard(digest)
+
+    def _rebuild_index(self) -> None:
+        # Entries evicted by LRU or expiry leave stale digests behind
+        self._by_user = {}
+        for digest, principal in self._entries.items():
+            for user_key in (str(principal.id), principal.email):
+                self._by_user.setdefault(user_key, set()).add(digest)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._entries.stats()
+
+
+class TokenEpochCache:
+    """Per-user ``token_version`` cache, looked up by email in ``verify_token``."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        # email -> (user id, token_version)
+        self._epochs: TTLCache[Tuple[str, int]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Not an LRU of its own: it must keep every id whose email is still cached
+        self._emails_by_id: Dict[str, Set[str]] = {}
+
+    def get(self, email: str) -> Optional[int]:
+        entry = self._epochs.get(email)
+        return entry[1] if entry is not None else None
+
+    def set(self, user_id: Any, email: str, token_version: int) -> None:
+        self._epochs.set(email, (str(user_id), token_version))
+        if len(self._emails_by_id) > 2 * self._epochs.maxsize:
+            self._rebuild_index()
+        self._emails_by_id.setdefault(str(user_id), set()).add(email)
+
+    def invalidate_user(self, **filters: Any) -> None:
+        if "email" in filters:
+            for email in _as_list(filters["email"]):
+                self._epochs.pop(email)
+        elif "id" in filters:
+            for user_id in _as_list(filters["id"]):
+                for email in self._emails_by_id.pop(str(user_id), set()):
+                    self._epochs.pop(email)
+        else:
+            self.clear()
+
+    def _rebuild_index(self) -> None:
+        # Entries evicted by LRU or expiry leave stale emails behind
+        self._emails_by_id = {}
+        for email, (user_id, _) in self._epochs.items():
+            self._emails_by_id.setdefault(user_id, set()).add(email)
+
+    def clear(self) -> None:
+        self._epochs.clear()
+        self._emails_by_id.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._epochs.stats()
+
+
+class RoleCache:
+    """``(org_id, roleName)`` -> role id cache, warmed on first use per organization."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._ids: TTLCache[str] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, org_id: Any, role_name: str) -> Optional[str]:
+        return self._ids.get((str(org_id), role_name))
+
+    def set(self, org_id: Any, role_name: str, role_id: Any) -> None:
+        self._ids.set((str(org_id), role_name), str(role_id))
+
+    def invalidate_role(self, **filters: Any) -> None:
+        # Only (org_id, roleName) addresses an entry; writes by id drop everything
+        if "org_id" not in filters or "roleName" not in filters:
+            self.clear()
+            return
+
+        for org_id in _as_list(filters["org_id"]):
+            for role_name in _as_list(filters["roleName"]):
+                self._ids.pop((str(org_id), role_name))
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._ids.stats()
+
+
+class MembershipCache:
+    """``(user_id, org_id, role_id)`` memberships known to be active.
+
+    Only hits are cached, so a new membership counts at once. Member writes
+    are rare and not addressed by these keys, so any of them drops everything.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._active: TTLCache[bool] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def has(self, user_id: Any, org_id: Any, role_id: Any) -> bool:
+        return self._active.get((str(user_id), str(org_id), str(role_id))) is not None
+
+    def add(self, user_id: Any, org_id: Any, role_id: Any) -> None:
+        self._active.set((str(user_id), str(org_id), str(role_id)), True)
+
+    def invalidate_member(self, **filters: Any) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self._active.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._active.stats()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+token_epoch_cache = TokenEpochCache(
+    maxsize=settings.TOKEN_EPOCH_CACHE_MAXSIZE,
+    ttl=settings.TOKEN_EPOCH_CACHE_TTL_SECONDS,
+)
+
+role_cache = RoleCache(
+    maxsize=settings.ROLE_CACHE_MAXSIZE,
+    ttl=settings.ROLE_CACHE_TTL_SECONDS,
+)
+
+membership_cache = MembershipCache(
+    maxsize=settings.MEMBERSHIP_CACHE_MAXSIZE,
+    ttl=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
@@ -58,10 +58,71 @@ class AppSettings(BaseSettings):
 class CryptSettings(BaseSettings):
     SECRET_KEY: str = config("SECRET_KEY", default="I_AM_WONDER_WOMAN")
     ALGORITHM: str = config("ALGORITHM", default="HS256")
+    # Comma-separated PEM private keys for RS*/ES* signing; the first one signs
+    JWT_PRIVATE_KEY_FILES: str = config("JWT_PRIVATE_KEY_FILES", default="")
+    JWKS_CACHE_MAX_AGE_SECONDS: int = config("JWKS_CACHE_MAX_AGE_SECONDS", default=3600)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = config(
         "ACCESS_TOKEN_EXPIRE_MINUTES", default=1440
     )
     REFRESH_TOKEN_EXPIRE_DAYS: int = config("REFRESH_TOKEN_EXPIRE_DAYS", default=7)
+    INTROSPECTION_MAX_BATCH: int = config("INTROSPECTION_MAX_BATCH", default=1000)
+    # Comma-separated bearer secrets of internal services (token introspection,
+    # health metrics); those endpoints refuse every caller while empty
+    SERVICE_CLIENT_SECRETS: str = config("SERVICE_CLIENT_SECRETS", default="")
+    RICH_CLAIMS_TOKENS: bool = config("RICH_CLAIMS_TOKENS", default=False)
+    REVOCATION_PURGE_INTERVAL_SECONDS: int = config(
+        "REVOCATION_PURGE_INTERVAL_SECONDS", default=3600
+    )
+    REVOCATION_PURGE_BATCH_SIZE: int = config("REVOCATION_PURGE_BATCH_SIZE", default=1000)
+
+
+class HashingSettings(BaseSettings):
+    HASHING_POOL_KIND: str = config("HASHING_POOL_KIND", default="thread")
+    HASHING_POOL_WORKERS: int = config(
+        "HASHING_POOL_WORKERS", default=min(4, os.cpu_count() or 1)
+    )
+    HASHING_POOL_MAX_PENDING: int = config("HASHING_POOL_MAX_PENDING", default=64)
+
+
+class ServerSettings(BaseSettings):
+    # Production launcher (serve.py); main.py keeps the single-process dev reloader
+    SERVER_WORKERS: int = config("SERVER_WORKERS", default=os.cpu_count() or 1)
+    SERVER_BACKLOG: int = config("SERVER_BACKLOG", default=2048)
+    SERVER_KEEPALIVE_SECONDS: int = config("SERVER_KEEPALIVE_SECONDS", default=5)
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: int = config("SERVER_GRACEFUL_SHUTDOWN_SECONDS", default=30)
+    SERVER_PROXY_HEADERS: bool = config("SERVER_PROXY_HEADERS", default=True)
+    SERVER_ACCESS_LOG: bool = config("SERVER_ACCESS_LOG", default=False)
+
+
+class CacheSettings(BaseSettings):
+    PRINCIPAL_CACHE_MAXSIZE: int = config("PRINCIPAL_CACHE_MAXSIZE", default=10000)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = config("PRINCIPAL_CACHE_TTL_SECONDS", default=60)
+    TOKEN_EPOCH_CACHE_MAXSIZE: int = config("TOKEN_EPOCH_CACHE_MAXSIZE", default=10000)
+    TOKEN_EPOCH_CACHE_TTL_SECONDS: int = config("TOKEN_EPOCH_CACHE_TTL_SECONDS", default=300)
+    ROLE_CACHE_MAXSIZE: int = config("ROLE_CACHE_MAXSIZE", default=10000)
+    ROLE_CACHE_TTL_SECONDS: int = config("ROLE_CACHE_TTL_SECONDS", default=3600)
+    MEMBERSHIP_CACHE_MAXSIZE: int = config("MEMBERSHIP_CACHE_MAXSIZE", default=10000)
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = config("MEMBERSHIP_CACHE_TTL_SECONDS", default=300)
+    # Read-through cache for CRUD lookups: "none", "memory" or "redis"
+    SHARED_CACHE_BACKEND: str = config("SHARED_CACHE_BACKEND", default="none")
+    SHARED_CACHE_REDIS_URL: str = config("SHARED_CACHE_REDIS_URL", default="redis://localhost:6379/0")
+    SHARED_CACHE_PREFIX: str = config("SHARED_CACHE_PREFIX", default="auth-cache")
+    SHARED_CACHE_MAXSIZE: int = config("SHARED_CACHE_MAXSIZE", default=10000)
+    SHARED_CACHE_TTL_SECONDS: int = config("SHARED_CACHE_TTL_SECONDS", default=60)
+    # Per-table overrides, e.g. "user_data=30,role_data=600"
+    SHARED_CACHE_MODEL_TTLS: str = config("SHARED_CACHE_MODEL_TTLS", default="")
+    # Cross-worker eviction of in-process caches: "none", "postgres" or "local".
+    # "postgres" (LISTEN/NOTIFY) refuses to start with DB_PGBOUNCER_MODE
+    INVALIDATION_BUS_BACKEND: str = config("INVALIDATION_BUS_BACKEND", default="postgres")
+    INVALIDATION_BUS_CHANNEL: str = config("INVALIDATION_BUS_CHANNEL", default="cache_invalidation")
+    INVALIDATION_BUS_SOCKET_DIR: str = config(
+        "INVALIDATION_BUS_SOCKET_DIR", default="/tmp/auth-invalidation"
+    )
+    REVOCATION_FILTER_CAPACITY: int = config("REVOCATION_FILTER_CAPACITY", default=100000)
+    REVOCATION_FILTER_ERROR_RATE: float = config("REVOCATION_FILTER_ERROR_RATE", default=0.01)
+    REVOCATION_FILTER_REFRESH_SECONDS: int = config(
+        "REVOCATION_FILTER_REFRESH_SECONDS", default=60
+    )
 
 
 class DatabaseSettings(BaseSettings):
@@ -80,6 +141,28 @@ class PostgresSettings(DatabaseSettings):
         f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
     )
     DATABASE_URL:str = POSTGRES_ASYNC_URI
+    BULK_COPY_THRESHOLD: int = config("BULK_COPY_THRESHOLD", default=5000)
+    # One commit per request: CRUD writes only flush and async_get_db commits
+    DB_UNIT_OF_WORK: bool = config("DB_UNIT_OF_WORK", default=False)
+    # Workers only check the schema version; DDL runs from migrate.py unless enabled
+    DB_MIGRATE_ON_STARTUP: bool = config("DB_MIGRATE_ON_STARTUP", default=False)
+    # Connection pool, per worker process
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", default=10)
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", default=10)
+    DB_POOL_TIMEOUT: float = config("DB_POOL_TIMEOUT", default=30.0)
+    DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", default=1800)
+    DB_POOL_PRE_PING: bool = config("DB_POOL_PRE_PING", default=True)
+    # Connections opened at startup, so the first requests skip connection setup
+    DB_POOL_WARMUP: int = config("DB_POOL_WARMUP", default=DB_POOL_SIZE)
+    DB_STATEMENT_CACHE_SIZE: int = config("DB_STATEMENT_CACHE_SIZE", default=100)
+    # Disables prepared statement caching for PgBouncer in transaction pooling mode;
+    # requires an INVALIDATION_BUS_BACKEND other than "postgres"
+    DB_PGBOUNCER_MODE: bool = config("DB_PGBOUNCER_MODE", default=False)
+    # Comma-separated asyncpg URIs of read replicas; reads use the primary if empty
+    DB_REPLICA_URIS: str = config("DB_REPLICA_URIS", default="")
+    # Replicas further behind than this are skipped until they catch up
+    DB_REPLICA_MAX_LAG_SECONDS: float = config("DB_REPLICA_MAX_LAG_SECONDS", default=5.0)
+    DB_REPLICA_CHECK_SECONDS: float = config("DB_REPLICA_CHECK_SECONDS", default=2.0)
 
 
 
@@ -93,6 +176,9 @@ class Settings(
     AppSettings,
     PostgresSettings,
     CryptSettings,
+    HashingSettings,
+    CacheSettings,
+    ServerSettings,
     API_Configs,
 ):
     pass
@@ -1,13 +1,18 @@
 # Built-in Dependencies
 from typing import Annotated, Union, Any, Dict
+from uuid import UUID
+import hmac
 import logging
+import time
 import os
 
 # Third-Party Dependencies
 from fastapi import Depends, HTTPException, Request
+from fastapi.security.utils import get_authorization_scheme_param
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
+from app.core.config import settings
 from app.db.crud.crud_user import crud_users
 from app.core.http_exceptions import (
     UnauthorizedException,
@@ -15,11 +20,13 @@ from app.core.http_exceptions import (
     # RateLimitException
 )
 
-from app.db.session import async_get_db
+from app.db.session import async_get_db, use_primary
 from app.core.security import oauth2_scheme, verify_token
 from app.db.schemas.v1.schema_user import UserRead
-from app.db.crud.crud_role import crud_role, get_role
-from app.db.schemas.v1.schema_role import RoleCreate
+from app.db.crud.crud_role import get_or_create_role_id
+from app.db.crud.crud_member import has_active_membership
+from app.core.cache import PrincipalSnapshot, principal_cache, token_digest
+from app.db.schemas.v1.schema_auth import TokenData
 
 # Logger instance
 logger = logging.getLogger(__name__)
@@ -32,54 +39,119 @@ async def get_current_user(
 
     credentials_exception = UnauthorizedException("User not authenticated.")
 
+    # Warm path: a token verified recently is served without touching the database
+    digest = token_digest(token)
+    principal = principal_cache.get(digest)
+    if principal is not None:
+        return principal.to_dict()
+
     token_data = await verify_token(token, db)
     if token_data is None:
         raise credentials_exception
 
+    principal = await _load_principal(token_data, digest, db)
+    if principal is not None:
+        return principal.to_dict()
+
+    # Raise an exception if the user is not authenticated
+    raise credentials_exception
+
+
+async def _load_principal(
+    token_data: TokenData, digest: str, db: AsyncSession
+) -> Union[PrincipalSnapshot, None]:
+    # The snapshot is cached, so it must not come from a lagging replica
+    use_primary(db)
+
     # Check if the authentication token represents an email or username and retrieve the user information
     if "@" in token_data.email:
         user: dict = await crud_users.get(
-            db=db, email=token_data.email, is_deleted=False
+            db=db, schema_to_select="principal", email=token_data.email, is_deleted=False
         )
     else:
         user = await crud_users.get(
-            db=db, username=token_data.email, is_deleted=False
+            db=db, schema_to_select="principal", username=token_data.email, is_deleted=False
         )
 
     if user:
-        # Return the user information if available
-        return user
+        # Cache the principal, never beyond the token's own expiry
+        principal = PrincipalSnapshot.from_row(user)
+        principal.org_id = token_data.org_id
+        ttl = token_data.exp - time.time() if token_data.exp else None
+        principal_cache.set(digest, principal, ttl=ttl)
+        return principal
 
-    # Raise an exception if the user is not authenticated
-    raise credentials_exception
+    return None
 
 
-async def ensure_owner_role(db: AsyncSession, org_id: str) -> Dict[str, Any]:
-    # Check if "owner" role exists
-    existing_role = await get_role(db=db, role_name="owner", org_id=org_id)
-    
-    if not existing_role:
-        # Create the "owner" role if it doesn't exist
-        role_data = RoleCreate(name="owner", description="Organization owner role", org_id=org_id)
-        new_role = await crud_role.create(db=db, obj_in=role_data)
-        logger.info(f"'Owner' role created successfully for organization {org_id}")
-        return new_role
-    
-    logger.info(f"'Owner' role already exists for organization {org_id}")
-    return existing_role
-
-async def get_current_owner(
-    current_user: Annotated[dict, Depends(get_current_user)], db: AsyncSession = Depends(async_get_db)
-) -> dict:
-    # Ensure that the "owner" role exists
-    owner_role = await ensure_owner_role(db=db, org_id=current_user['org_id'])
-
-    # Check if the user has the "owner" role
-    if owner_role and current_user.get("role") == "owner":
-        return current_user
+# Function to authorize from the token's own claims, without reading the user row
+async def get_current_claims(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(async_get_db)
+) -> TokenData:
+    token_data = await verify_token(token, db)
+    if token_data is None:
+        raise UnauthorizedException("User not authenticated.")
+
+    # Tokens minted without rich claims resolve them from the (cached) principal;
+    # the token is already verified, so a miss reads the user row directly
+    if token_data.user_id is None or token_data.user_role is None:
+        digest = token_digest(token)
+        principal = principal_cache.get(digest) or await _load_principal(token_data, digest, db)
+        if principal is None:
+            raise UnauthorizedException("User not authenticated.")
+        token_data = token_data.model_copy(
+            update={"user_id": str(principal.id), "user_role": principal.user_role}
+        )
+
+    return token_data
+
+
+async def ensure_owner_role(db: AsyncSession, org_id: str) -> str:
+    # Id of the organization's "owner" role, created on first use if missing
+    return await get_or_create_role_id(
+        db=db, org_id=UUID(org_id), roleName="owner", roleDescription="Owner of the Organization"
+    )
+
+
+async def require_owner(claims: TokenData, org_id: Union[UUID, str], db: AsyncSession) -> None:
+    """Raise unless the caller owns ``org_id``, the organization being acted on.
+
+    Rich-claims tokens minted as that organization's owner pass from memory;
+    otherwise the caller needs an active owner membership in it, cached once
+    found.
+    """
+    org_id = str(org_id)
+    owner_role_id = await ensure_owner_role(db=db, org_id=org_id)
+    if claims.org_id == org_id and claims.role_id == owner_role_id:
+        return
+    if await has_active_membership(
+        db=db, user_id=UUID(claims.user_id), org_id=UUID(org_id), role_id=UUID(owner_role_id)
+    ):
+        return
 
     raise ForbiddenException("You do not have owner privileges.")
 
+
+_service_client_secrets = [
+    secret.strip().encode("utf-8")
+    for secret in settings.SERVICE_CLIENT_SECRETS.split(",")
+    if secret.strip()
+]
+
+
+# Internal services authenticate with a shared secret sent as "Authorization: Bearer ..."
+async def get_service_client(request: Request) -> None:
+    scheme, secret = get_authorization_scheme_param(request.headers.get("Authorization"))
+    if scheme.lower() == "bearer" and secret:
+        candidate = secret.encode("utf-8")
+        # Compare against every secret so the timing does not reveal which one matched
+        matches = [hmac.compare_digest(candidate, known) for known in _service_client_secrets]
+        if any(matches):
+            return
+
+    raise UnauthorizedException("Service client not authenticated.")
+
+
 def create_folders(root_folder, sub_folders):
     # Create the root folder if it doesn't exist
     if not os.path.exists(root_folder):
@@ -93,4 +165,6 @@ def create_folders(root_folder, sub_folders):
 
 
 CurrentUser = Annotated[UserRead, Depends(get_current_user)]
-CurrentSuperUser = Annotated[UserRead, Depends(get_current_user)]
\ No newline at end of file
+CurrentClaims = Annotated[TokenData, Depends(get_current_claims)]
+CurrentSuperUser = Annotated[UserRead, Depends(get_current_user)]
+ServiceClient = Annotated[None, Depends(get_service_client)]
\ No newline at end of file
@@ -1,13 +1,133 @@
-from passlib.context import CryptContext
+# Built-in Dependencies
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+import asyncio
+import time
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Local Dependencies
+from app.core.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> Any:
+    # passlib and bcrypt are imported on the first hash, not when the app loads;
+    # token verification never needs them
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def _hash(plain_password: str) -> str:
+    return get_pwd_context().hash(plain_password)
+
+
+class HashingPool:
+    """Bounded worker pool that keeps bcrypt off the event loop.
+
+    ``kind`` selects a thread pool (bcrypt releases the GIL) or a process
+    pool. At most ``max_pending`` jobs are queued or running at once; further
+    callers wait for a free slot instead of piling work onto the executor.
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_pending: int) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Invalid hashing pool kind: {kind}. Only 'thread' or 'process' are valid.")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+        self._max_latency = 0.0
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so importing the module never forks or spawns threads
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hashing"
+                )
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+
+        submitted = time.perf_counter()
+        self._queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._queued -= 1
+
+        started = time.perf_counter()
+        self._running += 1
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        finally:
+            finished = time.perf_counter()
+            self._slots.release()
+            self._running -= 1
+            self._completed += 1
+            self._total_wait += started - submitted
+            self._total_run += finished - started
+            self._max_latency = max(self._max_latency, finished - submitted)
+
+    def stats(self) -> Dict[str, Any]:
+        completed = self._completed or 1
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queued": self._queued,
+            "running": self._running,
+            "completed": self._completed,
+            "avg_wait_ms": self._total_wait / completed * 1000,
+            "avg_run_ms": self._total_run / completed * 1000,
+            "max_latency_ms": self._max_latency * 1000,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            self._slots = None
+
+
+hashing_pool = HashingPool(
+    kind=settings.HASHING_POOL_KIND,
+    max_workers=settings.HASHING_POOL_WORKERS,
+    max_pending=settings.HASHING_POOL_MAX_PENDING,
+)
 
 
 class Hasher:
     @staticmethod
     def verify_password(plain_password, hashed_password):
-        return pwd_context.verify(plain_password, hashed_password)
+        return _verify(plain_password, hashed_password)
 
     @staticmethod
     def get_hash_password(plain_password):
-        return pwd_context.hash(plain_password)
+        return _hash(plain_password)
+
+    @staticmethod
+    async def averify_password(plain_password: str, hashed_password: str) -> bool:
+        return await hashing_pool.run(_verify, plain_password, hashed_password)
+
+    @staticmethod
+    async def aget_hash_password(plain_password: str) -> str:
+        return await hashing_pool.run(_hash, plain_password)
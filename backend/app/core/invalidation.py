@@ -0,0 +1,281 @@
+# Built-in Dependencies
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+from uuid import uuid4
+import asyncio
+import glob
+import inspect
+import json
+import logging
+import os
+import socket
+
+# Local Dependencies
+from app.core.config import settings
+from app.db.session import async_engine
+
+# Logger instance
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+class InvalidationBackend:
+    """Transport for ``InvalidationBus`` messages (JSON strings)."""
+
+    # Largest message the transport accepts, in bytes
+    max_message_size = 7900
+
+    async def start(self, deliver: Callable[[str], None], reset: Callable[[], None]) -> None:
+        raise NotImplementedError
+
+    async def publish(self, message: str) -> None:
+        raise NotImplementedError
+
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresInvalidationBackend(InvalidationBackend):
+    """``LISTEN/NOTIFY`` on one dedicated connection per worker.
+
+    Notifications sent while the connection is down are lost, so after a
+    reconnect subscribers get a ``reset`` and drop everything they cached.
+    The connection must not go through a transaction-pooling PgBouncer.
+    """
+
+    def __init__(self, channel: str, reconnect_delay: float = 1.0) -> None:
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._connection = None
+        self._driver_connection = None
+        self._lock = asyncio.Lock()
+        self._deliver: Optional[Callable[[str], None]] = None
+        self._reset: Optional[Callable[[], None]] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self, deliver: Callable[[str], None], reset: Callable[[], None]) -> None:
+        self._deliver = deliver
+        self._reset = reset
+        await self._connect()
+
+    async def _connect(self) -> None:
+        # Raw asyncpg connection outside any SQLAlchemy transaction, so LISTEN
+        # and pg_notify run in autocommit mode
+        self._connection = await async_engine.connect()
+        raw_connection = await self._connection.get_raw_connection()
+        self._driver_connection = raw_connection.driver_connection
+        await self._driver_connection.add_listener(self.channel, self._on_notify)
+        self._driver_connection.add_termination_listener(self._on_terminate)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._deliver(payload)
+
+    def _on_terminate(self, connection: Any) -> None:
+        if not self._stopping and self._reconnect_task is None:
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(self.reconnect_delay)
+            try:
+                await self._connection.invalidate()
+                await self._connect()
+            except Exception:
+                logger.exception("Invalidation bus reconnect failed")
+                continue
+
+            self._reconnect_task = None
+            self._reset()
+            return
+
+    async def publish(self, message: str) -> None:
+        # asyncpg runs one operation per connection at a time
+        async with self._lock:
+            await self._driver_connection.execute("SELECT pg_notify($1, $2)", self.channel, message)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._driver_connection is not None:
+            await self._driver_connection.remove_listener(self.channel, self._on_notify)
+        if self._connection is not None:
+            await self._connection.close()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, deliver: Callable[[str], None]) -> None:
+        self._deliver = deliver
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self._deliver(data.decode("utf-8"))
+
+
+class LocalInvalidationBackend(InvalidationBackend):
+    """Unix datagram sockets in a shared directory, one per process.
+
+    For worker processes on one host without a database round trip, e.g. in
+    tests. Publishing sends one datagram to every other socket in the
+    directory; sockets left behind by dead processes are removed.
+    """
+
+    max_message_size = 65000
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.path = os.path.join(directory, f"{os.getpid()}-{uuid4().hex[:8]}.sock")
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._sender: Optional[socket.socket] = None
+
+    async def start(self, deliver: Callable[[str], None], reset: Callable[[], None]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _DatagramProtocol(deliver), local_addr=self.path, family=socket.AF_UNIX
+        )
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+
+    async def publish(self, message: str) -> None:
+        data = message.encode("utf-8")
+        for path in glob.glob(os.path.join(self.directory, "*.sock")):
+            if path == self.path:
+                continue
+            try:
+                self._sender.sendto(data, path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Nobody is bound to it any more
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            except BlockingIOError:
+                logger.warning("Invalidation dropped: receive buffer of %s is full", path)
+
+    async def stop(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+        if self._sender is not None:
+            self._sender.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class InvalidationBus:
+    """Fan-out of cache invalidations to every other worker.
+
+    Writers ``publish`` after commit; each worker dispatches messages from
+    other workers to the handlers ``subscribe``d to the topic. Messages a
+    worker published itself are skipped: it already evicted locally.
+    """
+
+    def __init__(self, backend: Optional[InvalidationBackend]) -> None:
+        self.backend = backend
+        self.node_id = uuid4().hex
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._started = False
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    async def start(self) -> None:
+        if self.backend is None or self._started:
+            return
+        await self.backend.start(deliver=self._receive, reset=self._reset)
+        self._started = True
+
+    async def stop(self) -> None:
+        if self._started:
+            self._started = False
+            await self.backend.stop()
+
+    async def publish(
+        self, topic: str, payload: Dict[str, Any], fallback: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if not self._started:
+            return
+
+        message = self._encode(topic, payload)
+        if len(message.encode("utf-8")) > self.backend.max_message_size:
+            if fallback is None:
+                logger.warning("Invalidation for %s dropped: message too large", topic)
+                self.dropped += 1
+                return
+            message = self._encode(topic, fallback)
+
+        try:
+            await self.backend.publish(message)
+            self.published += 1
+        except Exception:
+            logger.exception("Invalidation for %s could not be published", topic)
+            self.errors += 1
+
+    def _encode(self, topic: str, payload: Dict[str, Any]) -> str:
+        return json.dumps(
+            {"origin": self.node_id, "topic": topic, "payload": payload},
+            default=str,
+            separators=(",", ":"),
+        )
+
+    def _receive(self, message: str) -> None:
+        data = json.loads(message)
+        if data["origin"] == self.node_id:
+            return
+
+        self.received += 1
+        asyncio.get_running_loop().create_task(self._dispatch(data["topic"], data["payload"]))
+
+    def _reset(self) -> None:
+        asyncio.get_running_loop().create_task(self._dispatch("reset", {}))
+
+    async def _dispatch(self, topic: str, payload: Dict[str, Any]) -> None:
+        for handler in self._handlers.get(topic, []):
+            try:
+                result = handler(payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Invalidation handler for %s failed", topic)
+                self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "published": self.published,
+            "received": self.received,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+def build_invalidation_bus() -> InvalidationBus:
+    if settings.INVALIDATION_BUS_BACKEND == "none":
+        backend = None
+    elif settings.INVALIDATION_BUS_BACKEND == "postgres":
+        # LISTEN only lasts as long as the server session, which transaction
+        # pooling hands to other clients after every transaction
+        if settings.DB_PGBOUNCER_MODE:
+            raise ValueError(
+                "INVALIDATION_BUS_BACKEND=postgres (LISTEN/NOTIFY) does not work through "
+                "PgBouncer in transaction pooling mode (DB_PGBOUNCER_MODE). Use 'local' for "
+                "workers on one host, or 'none' for a single worker."
+            )
+        backend = PostgresInvalidationBackend(channel=settings.INVALIDATION_BUS_CHANNEL)
+    elif settings.INVALIDATION_BUS_BACKEND == "local":
+        backend = LocalInvalidationBackend(directory=settings.INVALIDATION_BUS_SOCKET_DIR)
+    else:
+        raise ValueError(
+            f"Invalid INVALIDATION_BUS_BACKEND: {settings.INVALIDATION_BUS_BACKEND}. "
+            "Only 'none', 'postgres' or 'local' are valid."
+        )
+
+    return InvalidationBus(backend)
+
+
+invalidation_bus = build_invalidation_bus()
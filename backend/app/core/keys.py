@@ -0,0 +1,123 @@
+# Built-in Dependencies
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import hashlib
+import json
+
+# Third-Party Dependencies
+# The jose package itself is light; jwk/jwt pull in the crypto backends and
+# are imported when the keys are loaded
+from jose import JWTError
+
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+# Local Dependencies
+from app.core.config import settings
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512")
+
+
+class SigningKey:
+    """A pre-parsed signing/verification key tagged with its ``kid``."""
+
+    __slots__ = ("kid", "algorithm", "key", "public_jwk")
+
+    def __init__(self, kid: Optional[str], algorithm: str, key: "Key", public_jwk: Optional[dict]) -> None:
+        self.kid = kid
+        self.algorithm = algorithm
+        self.key = key
+        self.public_jwk = public_jwk
+
+
+class KeyRing:
+    """Keys used to sign and verify tokens.
+
+    With an HMAC algorithm the ring holds ``SECRET_KEY`` only. With an
+    asymmetric algorithm it holds one key per PEM file: the first file is the
+    active signing key and the rest are kept for verification while tokens
+    signed by retired keys expire. Every key is parsed once, by ``load``
+    (called at application startup) or on first use.
+    """
+
+    def __init__(self, algorithm: str, secret_key: str, private_key_files: List[str]) -> None:
+        self.algorithm = algorithm
+        self._secret_key = secret_key
+        self._private_key_files = private_key_files
+        self._keys: Dict[Optional[str], SigningKey] = {}
+        self._active: Optional[SigningKey] = None
+        self._jwt: Any = None
+        self._jwks_body: Optional[bytes] = None
+
+    def load(self) -> None:
+        if self._active is not None:
+            return
+
+        from jose import jwk, jwt
+
+        if self.is_asymmetric:
+            if not self._private_key_files:
+                raise ValueError(
+                    f"JWT_PRIVATE_KEY_FILES must be set when ALGORITHM is {self.algorithm}."
+                )
+            for path in self._private_key_files:
+                with open(path, "rb") as key_file:
+                    self._add_private_key(jwk, key_file.read())
+        else:
+            key = jwk.construct(self._secret_key, self.algorithm)
+            self._keys[None] = SigningKey(None, self.algorithm, key, None)
+
+        self._jwt = jwt
+        self._active = next(iter(self._keys.values()))
+
+    @property
+    def active(self) -> SigningKey:
+        if self._active is None:
+            self.load()
+        return self._active
+
+    def _add_private_key(self, jwk: Any, pem: bytes) -> None:
+        private_key = jwk.construct(pem, self.algorithm)
+        public_key = private_key.public_key()
+        public_jwk = public_key.to_dict()
+
+        # kid is a stable fingerprint of the public key material
+        material = json.dumps(public_jwk, sort_keys=True).encode("utf-8")
+        kid = hashlib.sha256(material).hexdigest()[:16]
+        public_jwk.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+
+        self._keys[kid] = SigningKey(kid, self.algorithm, private_key, public_jwk)
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.algorithm in ASYMMETRIC_ALGORITHMS
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        active = self.active
+        headers = {"kid": active.kid} if active.kid else None
+        return self._jwt.encode(claims, active.key, algorithm=self.algorithm, headers=headers)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        self.load()
+        kid = self._jwt.get_unverified_header(token).get("kid") if self.is_asymmetric else None
+        signing_key = self._keys.get(kid)
+        if signing_key is None:
+            raise JWTError("Unknown signing key.")
+
+        return self._jwt.decode(token, signing_key.key, algorithms=[self.algorithm])
+
+    def jwks(self) -> bytes:
+        # Serialized once: the key set only changes on restart
+        if self._jwks_body is None:
+            self.load()
+            keys = [key.public_jwk for key in self._keys.values() if key.public_jwk]
+            self._jwks_body = json.dumps({"keys": keys}, separators=(",", ":")).encode("utf-8")
+        return self._jwks_body
+
+
+key_ring = KeyRing(
+    algorithm=settings.ALGORITHM,
+    secret_key=settings.SECRET_KEY,
+    private_key_files=[
+        path.strip() for path in settings.JWT_PRIVATE_KEY_FILES.split(",") if path.strip()
+    ],
+)
@@ -0,0 +1,110 @@
+# Built-in Dependencies
+from typing import Dict, List, Optional, Any
+import asyncio
+import logging
+
+# Third-Party Dependencies
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local Dependencies
+from app.core.config import settings
+from app.db.crud.crud_auth import get_active_revoked_jtis, purge_expired_revocations
+from app.db.session import local_session, use_primary
+from app.utils.bloom import BloomFilter
+
+# Logger instance
+logger = logging.getLogger(__name__)
+
+
+class RevocationFilter:
+    """In-memory Bloom filter of revoked token identifiers (``jti``).
+
+    A miss proves the token was never revoked (as of the last load plus the
+    local ``add`` calls), so only hits need to be confirmed against the
+    database. Until the first load the filter is not ``ready`` and every
+    lookup falls through to the database.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ready = False
+        self._bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._added_during_rebuild: Optional[List[str]] = None
+
+    def add(self, jti: str) -> None:
+        self._bloom.add(jti)
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.append(jti)
+
+    def invalidate(self) -> None:
+        # Revocations may have been missed: check every token in the database
+        # until the next successful rebuild
+        self.ready = False
+
+    def might_be_revoked(self, jti: str) -> bool:
+        if not self.ready:
+            return True
+        return self._bloom.might_contain(jti)
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        # Revocations recorded while the query runs are replayed into the new filter
+        self._added_during_rebuild = []
+        try:
+            jtis = await get_active_revoked_jtis(db)
+            bloom = BloomFilter.from_items(
+                jtis,
+                capacity=self.capacity,
+                error_rate=self.error_rate,
+            )
+            for identifier in self._added_during_rebuild:
+                bloom.add(identifier)
+            self._bloom = bloom
+            self.ready = True
+        finally:
+            self._added_during_rebuild = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "entries": len(self._bloom),
+            "bits": self._bloom.num_bits,
+            "hashes": self._bloom.num_hashes,
+        }
+
+
+revoked_token_filter = RevocationFilter(
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
+
+
+async def load_revocation_filter() -> None:
+    async with local_session() as db:
+        # A lagging replica could miss the latest revocations
+        use_primary(db)
+        await revoked_token_filter.rebuild(db)
+    logger.info(f"Revocation filter loaded: {revoked_token_filter.stats()}")
+
+
+async def refresh_revocation_filter_periodically(interval: float) -> None:
+    # Rebuilding drops expired entries and picks up revocations from other workers
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load_revocation_filter()
+        except Exception as e:
+            logger.warning(f"Revocation filter refresh failed: {e}")
+
+
+async def purge_expired_revocations_periodically(interval: float, batch_size: int) -> None:
+    # Keeps the revocation table proportional to the number of live tokens
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with local_session() as db:
+                purged = await purge_expired_revocations(db, batch_size=batch_size)
+            if purged:
+                logger.info(f"Purged {purged} expired token revocations")
+        except Exception as e:
+            logger.warning(f"Token revocation purge failed: {e}")
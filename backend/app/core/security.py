@@ -1,5 +1,7 @@
-from typing import Optional, Dict, Literal, Union, Any
+from typing import Optional, Dict, List, Literal, Union, Any
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from uuid import uuid4
 
 
 # Third-Party Dependencies
@@ -8,16 +10,27 @@ from fastapi.security import OAuth2
 from fastapi.openapi.models import OAuthFlows as OAuthFlowsModel
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security.utils import get_authorization_scheme_param
-from jose import jwt, JWTError
+from jose import JWTError
 
 
 # Local Dependencies
 from app.core.config import settings
-from app.db.schemas.v1.schema_auth import TokenData, TokenBlacklistCreate
-from app.db.crud.crud_auth import crud_token_blacklist
-from app.db.crud.crud_user import crud_users, get_user
+from app.db.schemas.v1.schema_auth import TokenData, TokenClaims
+from app.db.crud.crud_auth import crud_token_blacklist, revoke_jti, get_revoked_jtis
+from app.db.crud.crud_user import crud_users, get_user, get_token_versions
+from app.db.crud.crud_member import crud_member
 from app.core.hashing import Hasher
-from app.db.session import async_get_db
+from app.core.keys import key_ring
+from app.core.cache import (
+    principal_cache,
+    token_epoch_cache,
+    role_cache,
+    membership_cache,
+    token_digest,
+)
+from app.core.invalidation import invalidation_bus
+from app.core.revocation import revoked_token_filter, load_revocation_filter
+from app.db.session import async_get_db, call_after_commit, await_after_commit, use_primary
 
 
 class OAuth2PasswordBearerWithCookie(OAuth2):
@@ -61,31 +74,54 @@ oauth2_scheme = OAuth2PasswordBearerWithCookie(tokenUrl="/auth/login")
 async def authenticate_user(
     email_or_password: str, password: str, db: AsyncSession
 ) -> Union[Dict[str, Any], Literal[False]]:
-    db_user = await get_user(email_or_password, db)
+    db_user = await get_user(email_or_password, db, schema_to_select="login")
 
     if not db_user:
         return False
 
-    elif not Hasher.verify_password(password, db_user["hashed_password"]):
+    elif not await Hasher.averify_password(password, db_user["hashed_password"]):
         return False
 
     return db_user
 
 
+# Function to collect the authorization claims embedded in "rich claims" tokens
+async def build_token_claims(user: Dict[str, Any], db: AsyncSession) -> TokenClaims:
+    # Organization claims only for a single active membership: with several,
+    # none of them is the token's organization, and owner checks resolve the
+    # organization being acted on instead
+    members = await crud_member.get_multi(
+        db=db,
+        limit=2,
+        schema_to_select=["org_id", "role_id"],
+        user_id=user["id"],
+        is_deleted=False,
+    )
+    member = members["data"][0] if len(members["data"]) == 1 else None
+    return TokenClaims(
+        user_id=str(user["id"]),
+        org_id=str(member["org_id"]) if member else None,
+        role_id=str(member["role_id"]) if member else None,
+        user_role=user["user_role"],
+    )
+
+
 async def create_access_token(
-    data: dict, expires_delta: Optional[timedelta] = None
+    data: dict,
+    expires_delta: Optional[timedelta] = None,
+    rich_claims: Optional[TokenClaims] = None,
 ) -> str:
     to_encode = data.copy()
+    if rich_claims:
+        to_encode.update(rich_claims.model_dump(exclude_none=True))
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    to_encode.update({"exp": expire, "jti": uuid4().hex})
+    encoded_jwt = key_ring.encode(to_encode)
     return encoded_jwt
 
 
@@ -100,47 +136,160 @@ async def create_refresh_token(
         expire = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
             days=settings.REFRESH_TOKEN_EXPIRE_DAYS
         )
-    to_encode.update({"exp": expire})
-    encoded_jwt: str = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    to_encode.update({"exp": expire, "jti": uuid4().hex})
+    encoded_jwt: str = key_ring.encode(to_encode)
     return encoded_jwt
 
 
+# Function to get the fixed-width revocation identifier of a decoded token
+def token_identifier(payload: Dict[str, Any], token: str) -> str:
+    # Tokens minted before jti was introduced fall back to a digest of equal width
+    return payload.get("jti") or token_digest(token)
+
+
 # Function to verify the validity of a token and return TokenData if valid
 async def verify_token(token: str, db: AsyncSession) -> TokenData:
 
-    is_blacklisted = await crud_token_blacklist.exists(db, token=token)
-    if is_blacklisted:
-        return None
-
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = key_ring.decode(token)
+
+        # Only tokens the revocation filter cannot rule out are checked in the database
+        jti = token_identifier(payload, token)
+        if revoked_token_filter.might_be_revoked(jti):
+            # A just-revoked token may not have reached the replicas yet
+            use_primary(db)
+            is_blacklisted = await crud_token_blacklist.exists(db, jti=jti)
+            if is_blacklisted:
+                return None
+
         email: str = payload.get("sub")
         if email is None:
             return None
 
-        user = await crud_users.get(db=db, email=email, is_deleted=False)
+        # Tokens issued before the user's last epoch bump are stale
+        token_version = token_epoch_cache.get(email)
+        if token_version is None:
+            # Cached for minutes: a replica still behind a session revocation
+            # would revive the old epoch
+            use_primary(db)
+            user = await crud_users.get(
+                db=db, schema_to_select="auth_check", email=email, is_deleted=False
+            )
 
-        if user:
-            return TokenData(email=email)
+            if not user:
+                # If user is not found in the shared cache or PostgreSQL, blacklist the token
+                await blacklist_token(token=token, db=db)
 
-        # If user is not found in Redis or PostgreSQL, blacklist the token
-        await blacklist_token(token=token, db=db)
+                return None
 
-        return None
+            token_version = user["token_version"]
+            token_epoch_cache.set(user["id"], email, token_version)
+
+        if payload.get("ver", 0) != token_version:
+            return None
+
+        return TokenData(
+            email=email,
+            exp=payload.get("exp"),
+            ver=token_version,
+            **{claim: payload.get(claim) for claim in TokenClaims.model_fields},
+        )
 
     except JWTError:
         return None
 
 
-# Function to blacklist a token by storing it in the database
+# Function to verify many tokens with one set-based query per table
+async def verify_tokens(tokens: List[str], db: AsyncSession) -> List[Optional[TokenData]]:
+    payloads: List[Optional[Dict[str, Any]]] = []
+    for token in tokens:
+        try:
+            payload = key_ring.decode(token)
+        except JWTError:
+            payload = None
+        payloads.append(payload if payload and payload.get("sub") else None)
+
+    jtis = [
+        token_identifier(payload, token)
+        if payload is not None else None
+        for payload, token in zip(payloads, tokens)
+    ]
+    candidates = {jti for jti in jtis if jti and revoked_token_filter.might_be_revoked(jti)}
+    if candidates:
+        use_primary(db)
+    revoked = await get_revoked_jtis(jtis=candidates, db=db)
+
+    token_versions: Dict[str, int] = {}
+    uncached_emails = set()
+    for payload, jti in zip(payloads, jtis):
+        if payload is None or jti in revoked:
+            continue
+        email = payload["sub"]
+        token_version = token_epoch_cache.get(email)
+        if token_version is None:
+            uncached_emails.add(email)
+        else:
+            token_versions[email] = token_version
+
+    for user in await get_token_versions(emails=uncached_emails, db=db):
+        token_versions[user["email"]] = user["token_version"]
+        token_epoch_cache.set(user["id"], user["email"], user["token_version"])
+
+    results: List[Optional[TokenData]] = []
+    for payload, jti in zip(payloads, jtis):
+        token_version = token_versions.get(payload["sub"]) if payload else None
+        if (
+            payload is None
+            or jti in revoked
+            or token_version is None
+            or payload.get("ver", 0) != token_version
+        ):
+            results.append(None)
+            continue
+
+        results.append(
+            TokenData(
+                email=payload["sub"],
+                exp=payload.get("exp"),
+                ver=token_version,
+                **{claim: payload.get(claim) for claim in TokenClaims.model_fields},
+            )
+        )
+
+    return results
+
+
+# Function to blacklist a token by storing its jti in the database
 async def blacklist_token(token: str, db: AsyncSession) -> None:
-    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    expires_at = datetime.fromtimestamp(payload.get("exp"))
-    await crud_token_blacklist.create(
+    payload = key_ring.decode(token)
+    jti = token_identifier(payload, token)
+    expires_at = datetime.fromtimestamp(payload.get("exp"), tz=timezone.utc)
+    await revoke_jti(jti=jti, expires_at=expires_at, db=db)
+    revoked_token_filter.add(jti)
+    call_after_commit(db, partial(principal_cache.invalidate_token, token))
+    await await_after_commit(
         db,
-        object=TokenBlacklistCreate(**{"token": token, "expires_at": expires_at}),
+        partial(invalidation_bus.publish, "token", {"jti": jti, "digest": token_digest(token)}),
     )
+
+
+# Function to apply a revocation published by another worker
+def _on_remote_revocation(payload: Dict[str, Any]) -> None:
+    revoked_token_filter.add(payload["jti"])
+    principal_cache.invalidate_digest(payload["digest"])
+
+
+# Function to drop everything cached in-process after missed invalidations
+async def _on_reset(payload: Dict[str, Any]) -> None:
+    # Fails closed: until the rebuild succeeds every token is checked in the
+    # database, and a failed rebuild is retried by the periodic refresh
+    revoked_token_filter.invalidate()
+    principal_cache.clear()
+    token_epoch_cache.clear()
+    role_cache.clear()
+    membership_cache.clear()
+    await load_revocation_filter()
+
+
+invalidation_bus.subscribe("token", _on_remote_revocation)
+invalidation_bus.subscribe("reset", _on_reset)
@@ -0,0 +1,309 @@
+# Built-in Dependencies
+from typing import Any, Dict, Optional, Tuple
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from uuid import UUID
+import json
+import logging
+
+# Third-Party Dependencies
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local Dependencies
+from app.core.config import settings
+from app.core.cache import TTLCache
+from app.db.session import UNIT_OF_WORK, WRITTEN_TABLES, await_after_commit
+from app.core.invalidation import invalidation_bus
+
+# Logger instance
+logger = logging.getLogger(__name__)
+
+# Returned by ``SharedCache.get`` for a miss; cached ``None`` rows are hits
+MISSING = object()
+
+# Never cached: lookups selecting them always go to the database
+UNCACHEABLE_COLUMNS = frozenset({"hashed_password"})
+
+# Tagged JSON for the column types rows carry beyond plain JSON
+_ENCODERS = {
+    UUID: ("$uuid", str),
+    datetime: ("$datetime", datetime.isoformat),
+    date: ("$date", date.isoformat),
+    Decimal: ("$decimal", str),
+}
+_DECODERS = {
+    "$uuid": UUID,
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$decimal": Decimal,
+}
+
+
+def _encode_value(value: Any) -> Dict[str, str]:
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        raise TypeError(f"Cannot cache a value of type {type(value).__name__}")
+    tag, encode = encoder
+    return {tag: encode(value)}
+
+
+def _decode_object(data: Dict[str, Any]) -> Any:
+    if len(data) == 1:
+        tag, value = next(iter(data.items()))
+        decode = _DECODERS.get(tag)
+        if decode is not None:
+            return decode(value)
+    return data
+
+
+def dumps(value: Any) -> bytes:
+    # JSON rather than pickle: loading data from the network must never run code
+    return json.dumps(value, default=_encode_value, separators=(",", ":")).encode("utf-8")
+
+
+def loads(payload: bytes) -> Any:
+    return json.loads(payload, object_hook=_decode_object)
+
+
+class CacheBackend:
+    """Storage for ``SharedCache``: values grouped in invalidatable namespaces.
+
+    Invalidating a namespace bumps its generation, and entries are stored
+    under the generation current when the value was *read*. A value read
+    before a concurrent write and stored after its invalidation therefore
+    lands under a dead generation instead of resurrecting stale data.
+    """
+
+    # Whether every worker sees the same entries (otherwise invalidations are broadcast)
+    shared = False
+
+    async def get(self, namespace: str, key: str) -> Tuple[int, Any]:
+        raise NotImplementedError
+
+    async def set(self, namespace: str, generation: int, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def invalidate(self, namespace: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local backend, for tests and single-worker deployments.
+
+    Entries are stored encoded, like in Redis: callers get their own copy
+    and cannot modify the cached row.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: TTLCache[bytes] = TTLCache(maxsize=maxsize, ttl=float("inf"))
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, namespace: str, key: str) -> Tuple[int, Any]:
+        generation = self._generations.get(namespace, 0)
+        payload = self._entries.get((namespace, generation, key))
+        return generation, loads(payload) if payload is not None else MISSING
+
+    async def set(self, namespace: str, generation: int, key: str, value: Any, ttl: float) -> None:
+        if generation == self._generations.get(namespace, 0):
+            self._entries.set((namespace, generation, key), dumps(value), ttl=ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        # Entries of older generations are unreachable and age out of the LRU
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend shared by every worker and node through a Redis server."""
+
+    shared = True
+
+    # Generation and entry in one round trip
+    GET_SCRIPT = """
+        local generation = redis.call('GET', KEYS[1]) or '0'
+        return {generation, redis.call('GET', ARGV[1] .. generation .. ':' .. ARGV[2])}
+    """
+
+    def __init__(self, url: str, prefix: str) -> None:
+        # Only imported when this backend is configured
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("SHARED_CACHE_BACKEND=redis requires the 'redis' package.")
+
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._get = self._client.register_script(self.GET_SCRIPT)
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:generation"
+
+    def _entry_prefix(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:"
+
+    async def get(self, namespace: str, key: str) -> Tuple[int, Any]:
+        generation, payload = await self._get(
+            keys=[self._generation_key(namespace)],
+            args=[self._entry_prefix(namespace), key],
+        )
+        value = loads(payload) if payload is not None else MISSING
+        return int(generation), value
+
+    async def set(self, namespace: str, generation: int, key: str, value: Any, ttl: float) -> None:
+        await self._client.set(
+            f"{self._entry_prefix(namespace)}{generation}:{key}",
+            dumps(value),
+            ex=max(1, int(ttl)),
+        )
+
+    async def invalidate(self, namespace: str) -> None:
+        await self._client.incr(self._generation_key(namespace))
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class SharedCache:
+    """Read-through cache for CRUD lookups, with per-namespace TTLs and metrics.
+
+    Namespaces are table names. Backend failures are logged and counted and
+    degrade to a miss, so an unavailable cache server only costs latency.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float, namespace_ttls: Dict[str, float]) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace_ttls = namespace_ttls
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, namespace: str, metric: str) -> None:
+        counters = self._stats.setdefault(
+            namespace, {"hits": 0, "misses": 0, "sets": 0, "invalidations": 0, "errors": 0}
+        )
+        counters[metric] += 1
+
+    def ttl_for(self, namespace: str) -> float:
+        return self.namespace_ttls.get(namespace, self.ttl)
+
+    async def get(self, namespace: str, key: str) -> Tuple[Optional[int], Any]:
+        try:
+            generation, value = await self.backend.get(namespace, key)
+        except Exception:
+            logger.exception("Shared cache lookup failed for %s", namespace)
+            self._count(namespace, "errors")
+            return None, MISSING
+
+        self._count(namespace, "misses" if value is MISSING else "hits")
+        return generation, value
+
+    async def set(self, namespace: str, generation: Optional[int], key: str, value: Any) -> None:
+        ttl = self.ttl_for(namespace)
+        if generation is None or ttl <= 0:
+            return
+
+        try:
+            await self.backend.set(namespace, generation, key, value, ttl)
+            self._count(namespace, "sets")
+        except Exception:
+            logger.exception("Shared cache store failed for %s", namespace)
+            self._count(namespace, "errors")
+
+    async def invalidate(self, namespace: str) -> None:
+        try:
+            await self.backend.invalidate(namespace)
+            self._count(namespace, "invalidations")
+        except Exception:
+            logger.exception("Shared cache invalidation failed for %s", namespace)
+            self._count(namespace, "errors")
+
+    async def invalidate_local(self, namespace: str) -> None:
+        # Applies an invalidation broadcast by another worker
+        if not self.backend.shared:
+            await self.invalidate(namespace)
+
+    def reset_local(self) -> None:
+        if not self.backend.shared:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {namespace: dict(counters) for namespace, counters in self._stats.items()}
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+def _parse_namespace_ttls(value: str) -> Dict[str, float]:
+    # "user_data=30,role_data=600"
+    ttls = {}
+    for item in value.split(","):
+        if item.strip():
+            namespace, ttl = item.split("=", 1)
+            ttls[namespace.strip()] = float(ttl)
+    return ttls
+
+
+def build_shared_cache() -> Optional[SharedCache]:
+    if settings.SHARED_CACHE_BACKEND == "none":
+        return None
+    elif settings.SHARED_CACHE_BACKEND == "memory":
+        backend = MemoryCacheBackend(maxsize=settings.SHARED_CACHE_MAXSIZE)
+    elif settings.SHARED_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(
+            url=settings.SHARED_CACHE_REDIS_URL, prefix=settings.SHARED_CACHE_PREFIX
+        )
+    else:
+        raise ValueError(
+            f"Invalid SHARED_CACHE_BACKEND: {settings.SHARED_CACHE_BACKEND}. "
+            "Only 'none', 'memory' or 'redis' are valid."
+        )
+
+    return SharedCache(
+        backend=backend,
+        ttl=settings.SHARED_CACHE_TTL_SECONDS,
+        namespace_ttls=_parse_namespace_ttls(settings.SHARED_CACHE_MODEL_TTLS),
+    )
+
+
+shared_cache = build_shared_cache()
+
+
+def can_read_cached(db: AsyncSession, namespace: str) -> bool:
+    # Within a unit of work, rows this session wrote must be read from the database
+    return shared_cache is not None and namespace not in db.info.get(WRITTEN_TABLES, ())
+
+
+async def invalidate_after_commit(db: AsyncSession, *namespaces: str, broadcast: bool = True) -> None:
+    # For writes that bypass CRUDBase, e.g. the signup CTE
+    if shared_cache is None:
+        return
+
+    for namespace in namespaces:
+        if db.info.get(UNIT_OF_WORK):
+            db.info.setdefault(WRITTEN_TABLES, set()).add(namespace)
+        await await_after_commit(db, partial(shared_cache.invalidate, namespace))
+        if broadcast and not shared_cache.backend.shared:
+            await await_after_commit(
+                db, partial(invalidation_bus.publish, "cache", {"namespace": namespace})
+            )
+
+
+async def _on_remote_invalidation(payload: Dict[str, Any]) -> None:
+    await shared_cache.invalidate_local(payload["namespace"])
+
+
+def _on_reset(payload: Dict[str, Any]) -> None:
+    shared_cache.reset_local()
+
+
+if shared_cache is not None:
+    invalidation_bus.subscribe("cache", _on_remote_invalidation)
+    invalidation_bus.subscribe("reset", _on_reset)
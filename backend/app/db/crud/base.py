@@ -1,12 +1,16 @@
 # Built-in Dependencies
-from typing import Any, Dict, Generic, List, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from datetime import datetime, timezone
+from functools import partial
+import hashlib
 
 # Third-Party Dependencies
-from sqlmodel import select, update, delete, func, and_, inspect, SQLModel
+from sqlmodel import select, update, delete, func, inspect, SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.engine.row import Row
-from sqlalchemy.sql import Join
+from sqlalchemy.sql import Join, Select
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert
 
 # Local Dependencies
 from app.db.crud.crud_helper import (
@@ -14,8 +18,27 @@ from app.db.crud.crud_helper import (
     _extract_matching_columns_from_kwargs,
     _auto_detect_join_condition,
     _add_column_with_prefix,
+    _build_filter_conditions,
+    _copy_rows,
+    _encode_cursor,
+    _decode_cursor,
+    _estimate_row_count,
+    _filter_shape,
+    _bound_filter_conditions,
+    _bound_filter_params,
 )
 from app.db.models.common import Base
+from app.core.config import settings
+from app.db.session import commit, call_after_commit, read_from_primary
+from app.core.shared_cache import (
+    MISSING,
+    UNCACHEABLE_COLUMNS,
+    shared_cache,
+    can_read_cached,
+    invalidate_after_commit,
+)
+from app.core.invalidation import invalidation_bus
+from app.db.session import await_after_commit, use_primary
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=SQLModel)
@@ -23,6 +46,9 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=SQLModel)
 UpdateSchemaInternalType = TypeVar("UpdateSchemaInternalType", bound=SQLModel)
 DeleteSchemaType = TypeVar("DeleteSchemaType", bound=SQLModel)
 
+# CRUD instances by table, to apply writes published by other workers
+_registry: Dict[str, "CRUDBase"] = {}
+
 
 class CRUDBase(
     Generic[
@@ -33,80 +59,263 @@ class CRUDBase(
         DeleteSchemaType,
     ]
 ):
-    def __init__(self, model: Type[ModelType]) -> None:
+    def __init__(
+        self,
+        model: Type[ModelType],
+        projections: Optional[Dict[str, List[str]]] = None,
+        cache: bool = False,
+    ) -> None:
         self._model = model
+        # Opt into the shared read-through cache for get/exists
+        self._cache = cache
+        self._namespace = model.__tablename__
+        # Named column profiles usable as ``schema_to_select="<name>"``
+        self._projections = {
+            name: tuple(columns) for name, columns in (projections or {}).items()
+        }
+        self._listeners: List[Callable[..., None]] = []
+        _registry[self._namespace] = self
+        self._statement_cache: Dict[tuple, Select] = {}
+
+    def add_listener(self, listener: Callable[..., None]) -> None:
+        # Listeners are called with the filters of every committed update/delete
+        self._listeners.append(listener)
+
+    def _resolve_projection(self, schema_to_select: Any) -> Any:
+        # A profile name stands for its column list; anything else passes through
+        if isinstance(schema_to_select, str):
+            return list(self._projections[schema_to_select])
+        return schema_to_select
+
+    async def _notify(self, db: AsyncSession, **kwargs: Any) -> None:
+        # Evicts locally after commit, then has every other worker do the same
+        for listener in self._listeners:
+            call_after_commit(db, partial(listener, **kwargs))
+        await self._invalidate_cache(db, broadcast=False)
+
+        if self._listeners or self._cache:
+            await await_after_commit(
+                db,
+                partial(
+                    invalidation_bus.publish,
+                    "table",
+                    {"table": self._namespace, "filters": kwargs},
+                    # Too many keys for one message: listeners drop everything instead
+                    fallback={"table": self._namespace, "filters": {}},
+                ),
+            )
+
+    async def _apply_remote_write(self, filters: Dict[str, Any]) -> None:
+        for listener in self._listeners:
+            listener(**filters)
+        if self._cache and shared_cache is not None:
+            await shared_cache.invalidate_local(self._namespace)
+
+    async def _invalidate_cache(self, db: AsyncSession, broadcast: bool = True) -> None:
+        # Any write may change the result of any cached lookup on this table
+        if self._cache:
+            await invalidate_after_commit(db, self._namespace, broadcast=broadcast)
+
+    def _cache_key(self, kind: str, schema_to_select: Any, kwargs: Dict[str, Any]) -> Optional[str]:
+        if not self._cache or shared_cache is None:
+            return None
+
+        if kind == "get":
+            # Credential hashes never leave the database, e.g. the "login" profile
+            columns = _extract_matching_columns_from_schema(
+                model=self._model, schema=self._resolve_projection(schema_to_select)
+            )
+            if any(column.key in UNCACHEABLE_COLUMNS for column in columns):
+                return None
+
+        if isinstance(schema_to_select, type):
+            schema_key = f"{schema_to_select.__module__}.{schema_to_select.__qualname__}"
+        else:
+            schema_key = repr(schema_to_select)
+        filters = sorted((key, repr(value)) for key, value in kwargs.items())
+        raw = repr((kind, schema_key, filters)).encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
     async def create(self, db: AsyncSession, object: CreateSchemaType) -> ModelType:
         object_dict = object.model_dump()
         db_object: ModelType = self._model(**object_dict)
         db.add(db_object)
-        await db.commit()
+        await commit(db)
+        await self._invalidate_cache(db)
         return db_object
 
+    def _cached_statement(
+        self, kind: str, schema_to_select: Any, kwargs: Dict[str, Any]
+    ) -> Select:
+        # Pre-built, parametrized statements per (kind, schema, filter shape):
+        # Python-side construction and SQLAlchemy cache-key generation run once
+        schema_to_select = self._resolve_projection(schema_to_select)
+        schema_key = tuple(schema_to_select) if isinstance(schema_to_select, list) else schema_to_select
+        shape = _filter_shape(kwargs)
+        cache_key = (kind, schema_key, shape)
+
+        stmt = self._statement_cache.get(cache_key)
+        if stmt is None:
+            conditions = _bound_filter_conditions(self._model, shape)
+            if kind == "get":
+                to_select = _extract_matching_columns_from_schema(
+                    model=self._model, schema=schema_to_select
+                )
+                # Plain Select: sqlmodel's select() of a single column would
+                # make exec() return bare scalars instead of rows
+                stmt = Select(*to_select).where(*conditions)
+            elif kind == "exists":
+                to_select = _extract_matching_columns_from_kwargs(
+                    model=self._model, kwargs=kwargs
+                )
+                stmt = select(*to_select).where(*conditions).limit(1)
+            else:
+                stmt = select(func.count()).select_from(self._model).where(*conditions)
+
+            if len(self._statement_cache) >= 512:
+                self._statement_cache.clear()
+            self._statement_cache[cache_key] = stmt
+
+        return stmt
+
     async def get(
         self,
         db: AsyncSession,
-        schema_to_select: Union[Type[SQLModel], List, None] = None,
+        schema_to_select: Union[Type[SQLModel], List, str, None] = None,
         **kwargs: Any,
     ) -> Dict:
-        to_select = _extract_matching_columns_from_schema(
-            model=self._model, schema=schema_to_select
-        )
-        stmt = select(*to_select).filter_by(**kwargs)
+        cache_key = self._cache_key("get", schema_to_select, kwargs)
+        if cache_key is not None and can_read_cached(db, self._namespace):
+            generation, cached = await shared_cache.get(self._namespace, cache_key)
+            if cached is not MISSING:
+                return dict(cached) if cached is not None else None
+        else:
+            generation = None
 
-        db_row = await db.exec(stmt)
+        stmt = self._cached_statement("get", schema_to_select, kwargs)
+
+        db_row = await db.exec(stmt, params=_bound_filter_params(kwargs))
         result: Row = db_row.first()
-        if result is not None:
-            out: dict = dict(result._mapping)
-            return out
+        out = dict(result._mapping) if result is not None else None
 
-        return None
+        # Filled from the primary only: a lagging replica would cache stale rows
+        if cache_key is not None and read_from_primary(db):
+            await shared_cache.set(self._namespace, generation, cache_key, out)
+
+        return out
 
     async def exists(self, db: AsyncSession, **kwargs: Any) -> bool:
-        to_select = _extract_matching_columns_from_kwargs(
-            model=self._model, kwargs=kwargs
-        )
-        stmt = select(*to_select).filter_by(**kwargs).limit(1)
+        cache_key = self._cache_key("exists", None, kwargs)
+        if cache_key is not None and can_read_cached(db, self._namespace):
+            generation, cached = await shared_cache.get(self._namespace, cache_key)
+            if cached is not MISSING:
+                return cached
+        else:
+            generation = None
 
-        result = await db.exec(stmt)
-        return result.first() is not None
+        stmt = self._cached_statement("exists", None, kwargs)
+
+        result = await db.exec(stmt, params=_bound_filter_params(kwargs))
+        found = result.first() is not None
+
+        if cache_key is not None and read_from_primary(db):
+            await shared_cache.set(self._namespace, generation, cache_key, found)
+
+        return found
 
     async def count(self, db: AsyncSession, **kwargs: Any) -> int:
-        if kwargs:
-            conditions = [
-                getattr(self._model, key) == value for key, value in kwargs.items()
-            ]
-            combined_conditions = and_(*conditions)
-            count_query = (
-                select(func.count())
-                .select_from(self._model)
-                .filter(combined_conditions)
+        count_query = self._cached_statement("count", None, kwargs)
+        total_count: int = await db.scalar(count_query, params=_bound_filter_params(kwargs))
+
+        return total_count
+
+    async def count_estimate(self, db: AsyncSession, **kwargs: Any) -> int:
+        stmt = select(*self._model.__table__.primary_key.columns).filter_by(**kwargs)
+        return await _estimate_row_count(db, stmt)
+
+    async def _paginate(
+        self,
+        db: AsyncSession,
+        stmt: Select,
+        offset: int,
+        limit: int,
+        cursor: Optional[str],
+        keyset: bool,
+        count: Optional[str],
+        filters: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        keyset = keyset or cursor is not None
+        if keyset:
+            # Keyset pagination on (created_at, id): an index range scan where an
+            # index leads with the equality filters and ends in (created_at, id),
+            # see v002_query_shape_indexes; otherwise each page sorts the matches
+            if "created_at" not in self._model.__table__.columns:
+                raise ValueError(
+                    f"Keyset pagination requires a created_at column on {self._model.__name__}."
+                )
+            created_at, id = self._model.created_at, self._model.id
+            stmt = stmt.add_columns(
+                created_at.label("_cursor_created_at"), id.label("_cursor_id")
             )
+            if cursor:
+                stmt = stmt.where(tuple_(created_at, id) > tuple_(*_decode_cursor(cursor)))
+            stmt = stmt.order_by(created_at, id).limit(limit + 1)
         else:
-            count_query = select(func.count()).select_from(self._model)
-        total_count: int = await db.scalar(count_query)
+            stmt = stmt.offset(offset).limit(limit)
 
-        return total_count
+        result = await db.exec(stmt)
+        data = [dict(row) for row in result.mappings()]
+
+        out: Dict[str, Any] = {}
+        if keyset:
+            next_cursor = None
+            if len(data) > limit:
+                data = data[:limit]
+                next_cursor = _encode_cursor(
+                    data[-1]["_cursor_created_at"], data[-1]["_cursor_id"]
+                )
+            for row in data:
+                del row["_cursor_created_at"], row["_cursor_id"]
+            out["next_cursor"] = next_cursor
+
+        out["data"] = data
+        if count == "exact":
+            out["total_count"] = await self.count(db=db, **filters)
+        elif count == "estimate":
+            out["total_count"] = await self.count_estimate(db=db, **filters)
+        elif count is not None:
+            raise ValueError(
+                f"Invalid count mode: {count}. Only 'exact' or 'estimate' are valid."
+            )
+
+        return out
 
     async def get_multi(
         self,
         db: AsyncSession,
         offset: int = 0,
         limit: int = 100,
-        schema_to_select: Union[Type[SQLModel], List[Type[SQLModel]], None] = None,
+        schema_to_select: Union[Type[SQLModel], List[Type[SQLModel]], str, None] = None,
+        cursor: Optional[str] = None,
+        keyset: bool = False,
+        count: Optional[str] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
+        """Page through rows matching ``kwargs``.
+
+        Pass ``keyset=True`` (first page) or the previous page's ``next_cursor``
+        to paginate by ``(created_at, id)`` instead of OFFSET. ``count`` adds
+        ``total_count``: ``"exact"`` runs COUNT(*), ``"estimate"`` uses the
+        planner's row estimate.
+        """
         to_select = _extract_matching_columns_from_schema(
-            model=self._model, schema=schema_to_select
+            model=self._model, schema=self._resolve_projection(schema_to_select)
         )
-        stmt = select(*to_select).filter_by(**kwargs).offset(offset).limit(limit)
-
-        result = await db.exec(stmt)
-        data = [dict(row) for row in result.mappings()]
-
-        total_count = await self.count(db=db, **kwargs)
+        stmt = select(*to_select).filter_by(**kwargs)
 
-        return {"data": data, "total_count": total_count}
+        return await self._paginate(
+            db, stmt, offset, limit, cursor, keyset, count, filters=kwargs
+        )
 
     async def get_joined(
         self,
@@ -178,6 +387,9 @@ class CRUDBase(
         join_type: str = "left",
         offset: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        keyset: bool = False,
+        count: Optional[str] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         if join_on is None:
@@ -215,14 +427,9 @@ class CRUDBase(
             if hasattr(self._model, key):
                 stmt = stmt.where(getattr(self._model, key) == value)
 
-        stmt = stmt.offset(offset).limit(limit)
-
-        db_rows = await db.exec(stmt)
-        data = [dict(row._mapping) for row in db_rows]
-
-        total_count = await self.count(db=db, **kwargs)
-
-        return {"data": data, "total_count": total_count}
+        return await self._paginate(
+            db, stmt, offset, limit, cursor, keyset, count, filters=kwargs
+        )
 
     async def update(
         self,
@@ -242,12 +449,14 @@ class CRUDBase(
         stmt = update(self._model).filter_by(**kwargs).values(update_data)
 
         await db.exec(stmt)
-        await db.commit()
+        await commit(db)
+        await self._notify(db, **kwargs)
 
     async def db_delete(self, db: AsyncSession, **kwargs: Any) -> None:
         stmt = delete(self._model).filter_by(**kwargs)
         await db.exec(stmt)
-        await db.commit()
+        await commit(db)
+        await self._notify(db, **kwargs)
 
     async def delete(self, db: AsyncSession, db_row: Row = None, **kwargs: Any) -> None:
         db_row = db_row or await self.exists(db=db, **kwargs)
@@ -260,9 +469,160 @@ class CRUDBase(
                 stmt = update(self._model).filter_by(**kwargs).values(object_dict)
 
                 await db.exec(stmt)
-                await db.commit()
+                await commit(db)
 
             else:
                 stmt = delete(self._model).filter_by(**kwargs)
                 await db.exec(stmt)
-                await db.commit()
+                await commit(db)
+
+            await self._notify(db, **kwargs)
+
+    def _build_rows(self, objects: List[Union[CreateSchemaType, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        # Instantiating the model applies its Python-side defaults (id, timestamps)
+        columns = self._model.__table__.columns
+        rows = []
+        for object in objects:
+            object_dict = object if isinstance(object, dict) else object.model_dump()
+            db_object = self._model(**object_dict)
+            rows.append({column.name: getattr(db_object, column.name) for column in columns})
+        return rows
+
+    async def create_multi(
+        self,
+        db: AsyncSession,
+        objects: List[Union[CreateSchemaType, Dict[str, Any]]],
+        use_copy: Union[bool, None] = None,
+    ) -> List[Dict[str, Any]]:
+        if not objects:
+            return []
+
+        rows = self._build_rows(objects)
+        if use_copy is None:
+            use_copy = (
+                len(rows) >= settings.BULK_COPY_THRESHOLD
+                and db.bind.dialect.name == "postgresql"
+            )
+
+        if use_copy:
+            use_primary(db)
+            await _copy_rows(db, self._model.__table__, rows)
+            await commit(db)
+            await self._invalidate_cache(db)
+            return rows
+
+        # Batched into multi-row INSERT ... RETURNING by SQLAlchemy's insertmanyvalues
+        stmt = insert(self._model).returning(*self._model.__table__.columns)
+        result = await db.execute(stmt, rows)
+        data = [dict(row) for row in result.mappings()]
+        await commit(db)
+        await self._invalidate_cache(db)
+        return data
+
+    async def upsert_multi(
+        self,
+        db: AsyncSession,
+        objects: List[Union[CreateSchemaType, Dict[str, Any]]],
+        index_elements: Union[List[str], None] = None,
+        update_columns: Union[List[str], None] = None,
+    ) -> List[Dict[str, Any]]:
+        if not objects:
+            return []
+
+        index_elements = index_elements or [
+            column.name for column in self._model.__table__.primary_key
+        ]
+
+        # Rows supplying the same keys share a statement; by default a conflict
+        # only updates the keys the caller supplied, never model defaults
+        groups: Dict[Tuple[str, ...], List[Union[CreateSchemaType, Dict[str, Any]]]] = {}
+        for object in objects:
+            if isinstance(object, dict):
+                supplied = object.keys()
+            else:
+                supplied = object.model_dump(exclude_unset=True).keys()
+            groups.setdefault(tuple(sorted(supplied)), []).append(object)
+
+        rows, data = [], []
+        for supplied, group in groups.items():
+            group_rows = self._build_rows(group)
+            group_columns = update_columns
+            if group_columns is None:
+                group_columns = [
+                    name for name in supplied
+                    if name in self._model.__table__.columns
+                    and name not in index_elements and name not in ("id", "created_at")
+                ]
+
+            stmt = insert(self._model)
+            if group_columns:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=index_elements,
+                    set_={name: stmt.excluded[name] for name in group_columns},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+            stmt = stmt.returning(*self._model.__table__.columns)
+
+            result = await db.execute(stmt, group_rows)
+            data.extend(dict(row) for row in result.mappings())
+            rows.extend(group_rows)
+        await commit(db)
+
+        # Only rows that already existed can be stale anywhere, but we cannot tell which
+        await self._notify(
+            db, **{name: [row[name] for row in rows] for name in index_elements}
+        )
+        return data
+
+    async def update_multi(
+        self,
+        db: AsyncSession,
+        object: Union[UpdateSchemaType, Dict[str, Any]],
+        **kwargs: Any,
+    ) -> int:
+        # List/tuple/set filter values become IN (...) conditions
+        if isinstance(object, dict):
+            update_data = object
+        else:
+            update_data = object.model_dump(exclude_unset=True)
+
+        if "updated_at" in update_data.keys():
+            update_data["updated_at"] = datetime.now(timezone.utc)
+
+        stmt = (
+            update(self._model)
+            .where(*_build_filter_conditions(self._model, kwargs))
+            .values(update_data)
+        )
+
+        result = await db.exec(stmt)
+        await commit(db)
+        await self._notify(db, **kwargs)
+        return result.rowcount
+
+    async def delete_multi(self, db: AsyncSession, **kwargs: Any) -> int:
+        # Soft-deletes when the model supports it, with IN (...) for list filters
+        conditions = _build_filter_conditions(self._model, kwargs)
+        if "is_deleted" in self._model.__table__.columns:
+            stmt = (
+                update(self._model)
+                .where(*conditions)
+                .values(is_deleted=True, deleted_at=datetime.now(timezone.utc))
+            )
+        else:
+            stmt = delete(self._model).where(*conditions)
+
+        result = await db.exec(stmt)
+        await commit(db)
+        await self._notify(db, **kwargs)
+        return result.rowcount
+
+
+async def _on_remote_write(payload: Dict[str, Any]) -> None:
+    crud = _registry.get(payload["table"])
+    if crud is not None:
+        await crud._apply_remote_write(payload["filters"])
+
+
+invalidation_bus.subscribe("table", _on_remote_write)
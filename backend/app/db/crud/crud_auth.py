@@ -1,3 +1,12 @@
+# Built-in Dependencies
+from typing import Iterable, List, Set
+from datetime import datetime, timezone
+
+# Third-Party Dependencies
+from sqlmodel import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 # Local Dependencies
 from app.db.schemas.v1.schema_auth import (
     TokenBlacklistCreate,
@@ -5,6 +14,7 @@ from app.db.schemas.v1.schema_auth import (
 )
 from app.db.models.auth import TokenBlacklist
 from app.db.crud.base import CRUDBase
+from app.db.session import commit
 
 # Define a CRUD (Create, Read, Update, Delete) interface for the TokenBlacklist model
 CRUDTokenBlacklist = CRUDBase[
@@ -17,3 +27,50 @@ CRUDTokenBlacklist = CRUDBase[
 
 # Create an instance of the CRUDTokenBlacklist with the TokenBlacklist model
 crud_token_blacklist = CRUDTokenBlacklist(TokenBlacklist)
+
+
+async def get_active_revoked_jtis(db: AsyncSession) -> List[str]:
+    stmt = select(TokenBlacklist.jti).where(
+        TokenBlacklist.expires_at > datetime.now(timezone.utc)
+    )
+    result = await db.exec(stmt)
+    return list(result.all())
+
+
+async def get_revoked_jtis(jtis: Iterable[str], db: AsyncSession) -> Set[str]:
+    jtis = list(jtis)
+    if not jtis:
+        return set()
+
+    stmt = select(TokenBlacklist.jti).where(TokenBlacklist.jti.in_(jtis))
+    result = await db.exec(stmt)
+    return set(result.all())
+
+
+async def revoke_jti(jti: str, expires_at: datetime, db: AsyncSession) -> None:
+    # Revoking an already revoked token (e.g. a repeated logout) is a no-op
+    stmt = (
+        insert(TokenBlacklist)
+        .values(jti=jti, expires_at=expires_at)
+        .on_conflict_do_nothing(index_elements=[TokenBlacklist.jti])
+    )
+    await db.exec(stmt)
+    await commit(db)
+
+
+async def purge_expired_revocations(db: AsyncSession, batch_size: int = 1000) -> int:
+    # Delete in bounded batches so a large backlog never holds long locks
+    purged = 0
+    while True:
+        expired = (
+            select(TokenBlacklist.jti)
+            .where(TokenBlacklist.expires_at <= datetime.now(timezone.utc))
+            .limit(batch_size)
+        )
+        stmt = delete(TokenBlacklist).where(TokenBlacklist.jti.in_(expired))
+        result = await db.exec(stmt)
+        await db.commit()
+
+        purged += result.rowcount
+        if result.rowcount < batch_size:
+            return purged
@@ -0,0 +1,28 @@
+# Built-in Dependencies
+from typing import Dict, Optional
+from uuid import UUID
+
+# Third-Party Dependencies
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Local Dependencies
+from app.db.models.counter import RoleCount, ALL_ORGANIZATIONS
+
+
+async def get_role_counts(
+    db: AsyncSession, org_id: Optional[UUID] = None, user_role: Optional[int] = None
+) -> Dict[int, int]:
+    # Primary-key range read of the trigger-maintained counters, summing the
+    # shards; roles without users are absent
+    stmt = (
+        select(RoleCount.user_role, func.sum(RoleCount.total).label("total"))
+        .where(RoleCount.org_id == (org_id or ALL_ORGANIZATIONS))
+        .group_by(RoleCount.user_role)
+    )
+    if user_role is not None:
+        stmt = stmt.where(RoleCount.user_role == user_role)
+
+    result = await db.exec(stmt)
+    # sum(bigint) is numeric
+    return {row.user_role: int(row.total) for row in result.all()}
@@ -1,13 +1,21 @@
 # Built-in Dependencies
-from typing import Any, List, Type, Union, Optional
+from typing import Any, Dict, List, Tuple, Type, Union, Optional
+from functools import lru_cache
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+import base64
+import json
 
 # Third-Party Dependencies
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.sql.elements import Label
-from sqlalchemy.sql import ColumnElement
-from sqlalchemy.sql.schema import Column
+from sqlalchemy.sql import ColumnElement, Select, bindparam, false, true
+from sqlalchemy.sql.schema import Column, Table
+from sqlalchemy.types import JSON
 from sqlmodel import inspect
 from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
 from app.db.models.common import Base
@@ -16,9 +24,18 @@ from app.db.models.common import Base
 def _extract_matching_columns_from_schema(
     model: Type[Base], schema: Union[Type[BaseModel], list, None]
 ) -> List[Any]:
+    schema_key = tuple(schema) if isinstance(schema, list) else schema
+    return list(_matching_columns_from_schema(model, schema_key))
+
+
+@lru_cache(maxsize=1024)
+def _matching_columns_from_schema(
+    model: Type[Base], schema: Union[Type[BaseModel], tuple, None]
+) -> Tuple[Any, ...]:
+    # Memoized: the hasattr scan over model fields runs once per (model, schema)
     column_list = list(model.__table__.columns)
     if schema is not None:
-        if isinstance(schema, list):
+        if isinstance(schema, tuple):
             schema_fields = schema
         else:
             schema_fields = schema.model_fields.keys()
@@ -28,18 +45,71 @@ def _extract_matching_columns_from_schema(
             if hasattr(model, column_name):
                 column_list.append(getattr(model, column_name))
 
-    return column_list
+    return tuple(column_list)
 
 
 def _extract_matching_columns_from_kwargs(model: Type[Base], kwargs: dict) -> List[Any]:
-    if kwargs is not None:
-        kwargs_fields = kwargs.keys()
-        column_list = []
-        for column_name in kwargs_fields:
-            if hasattr(model, column_name):
-                column_list.append(getattr(model, column_name))
+    return list(_matching_columns_from_names(model, tuple(kwargs.keys())))
 
-    return column_list
+
+@lru_cache(maxsize=1024)
+def _matching_columns_from_names(model: Type[Base], column_names: Tuple[str, ...]) -> Tuple[Any, ...]:
+    column_list = []
+    for column_name in column_names:
+        if hasattr(model, column_name):
+            column_list.append(getattr(model, column_name))
+
+    return tuple(column_list)
+
+
+def _filter_shape(kwargs: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    # The part of a filter that determines the SQL text, independent of the values.
+    # Booleans stay literal: with a bound ``is_deleted``, a generic prepared plan
+    # cannot use the ``WHERE is_deleted = false`` partial indexes
+    shape = []
+    for key, value in kwargs.items():
+        if value is None:
+            shape.append((key, "null"))
+        elif isinstance(value, bool):
+            shape.append((key, "true" if value else "false"))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            shape.append((key, "in"))
+        else:
+            shape.append((key, "eq"))
+
+    return tuple(shape)
+
+
+def _bound_filter_conditions(
+    model: Type[Base], shape: Tuple[Tuple[str, str], ...]
+) -> List[ColumnElement]:
+    conditions = []
+    for key, kind in shape:
+        column = getattr(model, key)
+        if kind == "null":
+            conditions.append(column.is_(None))
+        elif kind == "true":
+            conditions.append(column == true())
+        elif kind == "false":
+            conditions.append(column == false())
+        elif kind == "in":
+            conditions.append(column.in_(bindparam(f"filter_{key}", expanding=True)))
+        else:
+            conditions.append(column == bindparam(f"filter_{key}"))
+
+    return conditions
+
+
+def _bound_filter_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    params = {}
+    for key, value in kwargs.items():
+        if value is None or isinstance(value, bool):
+            continue
+        if isinstance(value, (set, frozenset, tuple)):
+            value = list(value)
+        params[f"filter_{key}"] = value
+
+    return params
 
 
 def _extract_matching_columns_from_column_names(
@@ -79,3 +149,66 @@ def _auto_detect_join_condition(
 def _add_column_with_prefix(column: Column, prefix: Optional[str]) -> Label:
     column_label = f"{prefix}{column.name}" if prefix else column.name
     return column.label(column_label)
+
+
+def _build_filter_conditions(model: Type[Base], kwargs: Dict[str, Any]) -> List[ColumnElement]:
+    conditions = []
+    for key, value in kwargs.items():
+        column = getattr(model, key)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            conditions.append(column.in_(list(value)))
+        else:
+            conditions.append(column == value)
+
+    return conditions
+
+
+async def _copy_rows(db: AsyncSession, table: Table, rows: List[Dict[str, Any]]) -> None:
+    # COPY ... FROM STDIN through the session's asyncpg connection
+    columns = list(rows[0].keys())
+    json_columns = {column.name for column in table.columns if isinstance(column.type, JSON)}
+
+    def _encode(name: str, value: Any) -> Any:
+        if name in json_columns and value is not None:
+            return json.dumps(value)
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    records = [tuple(_encode(name, row[name]) for name in columns) for row in rows]
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
+
+
+def _encode_cursor(created_at: datetime, id: Any) -> str:
+    payload = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+async def _estimate_row_count(db: AsyncSession, stmt: Select) -> int:
+    # Planner estimate via EXPLAIN: constant time regardless of table size
+    connection = await db.connection()
+    compiled = stmt.compile(dialect=connection.dialect)
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -1,4 +1,5 @@
 from typing import Dict, Any, Literal, Union
+from uuid import UUID
 
 # Third-Party Dependencies
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -23,6 +24,8 @@ from app.core.http_exceptions import (
 )
 
 from app.core.hashing import Hasher
+from app.core.cache import membership_cache
+from app.db.session import use_primary
 
 CRUDMember = CRUDBase[
     Member, MemberCreateInternal, MemberUpdate, MemberUpdateInternal, MemberDelete
@@ -30,6 +33,9 @@ CRUDMember = CRUDBase[
 
 crud_member = CRUDMember(Member)
 
+# Drop cached memberships whenever a member row is updated or deleted
+crud_member.add_listener(membership_cache.invalidate_member)
+
 
 async def create_new_member(member: MemberCreate, db: AsyncSession) -> MemberRead:
     memberName_row = await crud_member.exists(db=db, memberName=member.memberName)
@@ -48,4 +54,21 @@ async def get_member(memberName: str, db: AsyncSession) -> Union[Dict[str, Any],
     if not db_member:
         return None
     
-    return db_member
\ No newline at end of file
+    return db_member
+
+
+async def has_active_membership(
+    db: AsyncSession, user_id: UUID, org_id: UUID, role_id: UUID
+) -> bool:
+    # Memory-only once the membership was seen; misses always ask the primary,
+    # since they decide an authorization and the replicas may lag
+    if membership_cache.has(user_id, org_id, role_id):
+        return True
+
+    use_primary(db)
+    found = await crud_member.exists(
+        db=db, user_id=user_id, org_id=org_id, role_id=role_id, is_deleted=False
+    )
+    if found:
+        membership_cache.add(user_id, org_id, role_id)
+    return bool(found)
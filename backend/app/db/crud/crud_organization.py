@@ -28,7 +28,7 @@ CRUDOrganization = CRUDBase[
     Organization, OrganizationCreateInternal, OrganizationUpdate, OrganizationUpdateInternal, OrganizationDelete
 ]
 
-crud_organization = CRUDOrganization(Organization)
+crud_organization = CRUDOrganization(Organization, cache=True)
 
 
 async def create_new_organization(organization: OrganizationCreate, db: AsyncSession) -> OrganizationRead:
@@ -1,7 +1,10 @@
-from typing import Dict, Any, Literal, Union
+from typing import Dict, Any, Literal, Optional, Union
+from functools import partial
+from uuid import UUID, uuid4
 
 # Third-Party Dependencies
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
 
 # Local Dependencies
 from app.db.crud.base import CRUDBase
@@ -23,16 +26,22 @@ from app.core.http_exceptions import (
 )
 
 from app.core.hashing import Hasher
+from app.core.cache import role_cache
+from app.db.session import commit, call_after_commit, use_primary
+from app.core.shared_cache import invalidate_after_commit
 
 CRUDRole = CRUDBase[
     Role, RoleCreateInternal, RoleUpdate, RoleUpdateInternal, RoleDelete
 ]
 
-crud_role = CRUDRole(Role)
+crud_role = CRUDRole(Role, cache=True)
+
+# Drop cached role ids whenever a role row is updated or deleted
+crud_role.add_listener(role_cache.invalidate_role)
 
 
 async def create_new_role(role: RoleCreate, db: AsyncSession) -> RoleRead:
-    roleName_row = await crud_role.exists(db=db, roleName=role.roleName)
+    roleName_row = await crud_role.exists(db=db, org_id=role.org_id, roleName=role.roleName)
     if roleName_row:
         raise DuplicateValueException("Role is already registered")
 
@@ -42,11 +51,53 @@ async def create_new_role(role: RoleCreate, db: AsyncSession) -> RoleRead:
     print(role_internal)
     return await crud_role.create(db=db, object=role_internal)
 
-async def get_role(roleName: str, db: AsyncSession) -> Union[Dict[str, Any], Literal[None]]:
+async def get_role(
+    roleName: str, db: AsyncSession, org_id: Optional[UUID] = None
+) -> Union[Dict[str, Any], Literal[None]]:
+    filters = {"org_id": org_id} if org_id is not None else {}
     db_role: dict = await crud_role.get(
-            db=db, roleName=roleName, is_deleted=False
+            db=db, roleName=roleName, is_deleted=False, **filters
     )
     if not db_role:
         return None
     
-    return db_role
\ No newline at end of file
+    return db_role
+
+
+async def get_or_create_role_id(
+    db: AsyncSession, org_id: UUID, roleName: str, roleDescription: Optional[str] = None
+) -> str:
+    # Memory-only once warm; otherwise one INSERT that is a no-op when an active
+    # role exists, relying on the unique (org_id, roleName) constraint to settle
+    # races. A soft-deleted role holding the name is restored instead
+    role_id = role_cache.get(org_id, roleName)
+    if role_id is not None:
+        return role_id
+
+    stmt = (
+        insert(Role)
+        .values(id=uuid4(), org_id=org_id, roleName=roleName, roleDescription=roleDescription)
+        .on_conflict_do_update(
+            index_elements=[Role.org_id, Role.roleName],
+            set_={"is_deleted": False, "deleted_at": None},
+            where=Role.is_deleted,
+        )
+        .returning(Role.id)
+    )
+    result = await db.exec(stmt)
+    created_id = result.scalar_one_or_none()
+
+    if created_id is not None:
+        await commit(db)
+        await invalidate_after_commit(db, Role.__tablename__)
+        # Not cached before commit: a rolled back insert must not leave its id behind
+        call_after_commit(db, partial(role_cache.set, org_id, roleName, created_id))
+        return str(created_id)
+
+    # Written by a concurrent request, possibly not on the replicas yet
+    use_primary(db)
+    db_role = await crud_role.get(
+        db=db, schema_to_select=["id"], org_id=org_id, roleName=roleName, is_deleted=False
+    )
+    role_cache.set(org_id, roleName, db_role["id"])
+    return str(db_role["id"])
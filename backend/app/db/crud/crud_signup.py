@@ -0,0 +1,146 @@
+from typing import Dict, Any, Type
+from functools import partial
+from uuid import uuid4
+
+# Third-Party Dependencies
+from sqlmodel import select, func
+from sqlalchemy import literal
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import FromClause
+from sqlalchemy.sql.dml import Insert
+
+# Local Dependencies
+from app.db.models.common import Base
+from app.db.models.user import User
+from app.db.models.organization import Organization
+from app.db.models.role import Role
+from app.db.models.member import Member
+from app.db.schemas.v1.schema_auth import SignUpCreate
+from app.db.schemas.v1.schema_user import UserCreateInternal
+from app.db.schemas.v1.schema_organization import OrganizationCreateInternal
+from app.db.schemas.v1.schema_role import RoleCreateInternal
+from app.db.schemas.v1.schema_member import MemberCreateInternal
+from app.db.session import commit, call_after_commit, use_primary
+
+from app.core.http_exceptions import DuplicateValueException
+from app.core.hashing import Hasher
+from app.core.cache import role_cache
+from app.core.shared_cache import invalidate_after_commit
+
+
+def _row(model: Type[Base], values: Dict[str, Any]) -> Dict[str, Any]:
+    # Python-side column defaults (timestamps, the soft-delete flag) only run for
+    # the top-level statement, never inside a CTE, so every column is bound here
+    record = model(**values)
+    return {column.name: getattr(record, column.name) for column in model.__table__.c}
+
+
+def _insert_from(model: Type[Base], values: Dict[str, Any], source: FromClause) -> Insert:
+    # One row of bound values per row of ``source`` (i.e. none if the parent insert was skipped)
+    columns = model.__table__.c
+    row = _row(model, values)
+    return insert(model).from_select(
+        list(row),
+        select(
+            *[literal(value, type_=columns[name].type).label(name) for name, value in row.items()]
+        ).select_from(source),
+        include_defaults=False,
+    )
+
+
+async def create_new_signup(signup: SignUpCreate, db: AsyncSession) -> Dict[str, Any]:
+    """Create user, organization, owner role and member in a single statement.
+
+    The inserts are chained data-modifying CTEs: each one selects from the
+    RETURNING of its parent, so a uniqueness conflict (``ON CONFLICT DO
+    NOTHING``) on the email, organization name or member name skips every
+    dependent insert. Primary keys are generated up front, so nothing has to be
+    read back. The password is hashed before the session checks out a
+    connection, so no pooled connection sits idle during bcrypt.
+    """
+    hashed_password = await Hasher.aget_hash_password(signup.password)
+    # A SELECT over data-modifying CTEs: must not be routed to a replica
+    use_primary(db)
+
+    user_id, org_id, role_id, member_id = uuid4(), uuid4(), uuid4(), uuid4()
+
+    user_values = UserCreateInternal(
+        email=signup.email,
+        userProfile=signup.userProfile,
+        userStatus=signup.userStatus,
+        userSettings=signup.userSettings,
+        user_role=signup.user_role,
+        hashed_password=hashed_password,
+    ).model_dump()
+    organization_values = OrganizationCreateInternal(
+        organizationName=signup.organizationName,
+        organizationStatus=signup.organizationStatus,
+        organizationPersonal=signup.organizationPersonal,
+        organizationSettings=signup.organizationSettings,
+    ).model_dump()
+    role_values = RoleCreateInternal(
+        roleName="owner",
+        roleDescription="Owner of the Organization",
+        org_id=org_id,
+    ).model_dump()
+    member_values = MemberCreateInternal(
+        user_id=user_id,
+        org_id=org_id,
+        role_id=role_id,
+        memberName=signup.memberName,
+        memberStatus=signup.memberStatus,
+    ).model_dump()
+
+    new_user = (
+        insert(User)
+        .values(**_row(User, {"id": user_id, **user_values}))
+        .on_conflict_do_nothing()
+        .returning(User.id)
+        .cte("new_user")
+    )
+    organization_row = {"id": org_id, **organization_values}
+    new_organization = (
+        _insert_from(Organization, organization_row, new_user)
+        .on_conflict_do_nothing()
+        .returning(Organization.id)
+        .cte("new_organization")
+    )
+    role_row = {"id": role_id, **role_values}
+    new_role = (
+        _insert_from(Role, role_row, new_organization)
+        .returning(Role.id)
+        .cte("new_role")
+    )
+    member_row = {"id": member_id, **member_values}
+    new_member = (
+        _insert_from(Member, member_row, new_role)
+        .on_conflict_do_nothing()
+        .returning(Member.id)
+        .cte("new_member")
+    )
+
+    stmt = select(
+        select(func.count()).select_from(new_user).scalar_subquery().label("users"),
+        select(func.count()).select_from(new_organization).scalar_subquery().label("organizations"),
+        select(func.count()).select_from(new_member).scalar_subquery().label("members"),
+    )
+    result = await db.exec(stmt)
+    created = result.one()
+
+    if not created.members:
+        # Undo the partial chain, e.g. a user inserted before the organization conflicted
+        await db.rollback()
+        if not created.users:
+            raise DuplicateValueException("Email is already registered")
+        if not created.organizations:
+            raise DuplicateValueException("Organization name is already registered")
+        raise DuplicateValueException("Member is already registered")
+
+    await commit(db)
+    await invalidate_after_commit(
+        db, User.__tablename__, Organization.__tablename__, Role.__tablename__
+    )
+    # The new organization's owner checks start warm
+    call_after_commit(db, partial(role_cache.set, org_id, role_values["roleName"], role_id))
+    return member_row
@@ -1,6 +1,7 @@
-from typing import Dict, Any, Literal, Union
+from typing import Dict, Any, Iterable, List, Literal, Optional, Union
 
 # Third-Party Dependencies
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Local Dependencies
@@ -22,14 +23,27 @@ from app.core.http_exceptions import (
 )
 
 from app.core.hashing import Hasher
+from app.core.cache import principal_cache, token_epoch_cache
+from app.db.session import use_primary
 
 # CRUD operations for the 'User' model
 CRUDUser = CRUDBase[
     User, UserCreateInternal, UserUpdate, UserUpdateInternal, UserDelete
 ]
 
+# Column profiles for hot-path lookups; none of them loads the JSON columns
+USER_PROJECTIONS = {
+    "auth_check": ["id", "is_deleted", "token_version"],
+    "login": ["id", "email", "hashed_password", "token_version", "user_role"],
+    "principal": ["id", "email", "user_role", "userStatus"],
+}
+
 # Create an instance of CRUDUser for the 'User' model
-crud_users = CRUDUser(User)
+crud_users = CRUDUser(User, projections=USER_PROJECTIONS, cache=True)
+
+# Drop cached principals and token epochs whenever a user row is updated or deleted
+crud_users.add_listener(principal_cache.invalidate_user)
+crud_users.add_listener(token_epoch_cache.invalidate_user)
 
 
 async def create_new_user(user: UserCreate, db: AsyncSession) -> UserRead:
@@ -38,7 +52,7 @@ async def create_new_user(user: UserCreate, db: AsyncSession) -> UserRead:
         raise DuplicateValueException("Email is already registered")
 
     user_internal_dict = user.model_dump()
-    user_internal_dict["hashed_password"] = Hasher.get_hash_password(
+    user_internal_dict["hashed_password"] = await Hasher.aget_hash_password(
         plain_password=user_internal_dict["password"]
     )
     del user_internal_dict["password"]
@@ -47,12 +61,44 @@ async def create_new_user(user: UserCreate, db: AsyncSession) -> UserRead:
     print(user_internal)
     return await crud_users.create(db=db, object=user_internal)
 
-async def get_user(email: str, db: AsyncSession) -> Union[Dict[str, Any], Literal[None]]:
+async def get_user(
+    email: str, db: AsyncSession, schema_to_select: Optional[str] = None
+) -> Union[Dict[str, Any], Literal[None]]:
     if "@" in email:
         db_user: dict = await crud_users.get(
-            db=db, email=email, is_deleted=False
+            db=db, schema_to_select=schema_to_select, email=email, is_deleted=False
         )
         return db_user
     else:
         return None
-    
\ No newline at end of file
+
+
+async def get_token_versions(emails: Iterable[str], db: AsyncSession) -> List[Dict[str, Any]]:
+    emails = list(emails)
+    if not emails:
+        return []
+
+    # Callers cache the epochs; a lagging replica would revive revoked sessions
+    use_primary(db)
+    stmt = (
+        select(User.id, User.email, User.token_version)
+        .where(User.email.in_(emails))
+        .filter_by(is_deleted=False)
+    )
+    result = await db.exec(stmt)
+    return [dict(row._mapping) for row in result.all()]
+
+
+async def revoke_user_sessions(
+    db: AsyncSession, object: Optional[Dict[str, Any]] = None, **kwargs: Any
+) -> None:
+    # Bumping token_version invalidates every token issued to the user so far,
+    # optionally in the same statement as other changes to the user
+    update_data = dict(object or {})
+    update_data["token_version"] = User.token_version + 1
+    await crud_users.update(db=db, object=update_data, **kwargs)
+
+
+async def delete_user(db: AsyncSession, **kwargs: Any) -> None:
+    await revoke_user_sessions(db=db, **kwargs)
+    await crud_users.delete(db=db, **kwargs)
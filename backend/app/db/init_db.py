@@ -1,22 +1,47 @@
 # Built-in Dependencies
-import asyncio
-
-# Third-Party Dependencies
-from sqlmodel import select
+from typing import List
+import logging
 
 # Local Dependencies
+from app.core.config import settings
 from app.db.session import async_engine as engine
-from app.core.hashing import Hasher
 from app.db.models.common import Base
 from app.db.models.user import User
 from app.db.models.organization import Organization
 from app.db.models.role import Role
 from app.db.models.member import Member
+from app.db.models.counter import RoleCount
+from app.db.migrations import lock_migrations, pending_versions, run_migrations
+
+# Logger instance
+logger = logging.getLogger(__name__)
 
 
-async def init_tables() -> None:
+async def init_tables() -> List[int]:
     async with engine.begin() as conn:
+        # Serialises concurrent migrate runs, create_all included
+        await lock_migrations(conn)
         await conn.run_sync(Base.metadata.create_all)
+        # Columns, constraints and indexes that create_all cannot add to existing tables
+        return await run_migrations(conn)
+
+
+async def check_schema() -> List[int]:
+    # One read-only round trip instead of create_all's catalog queries per table
+    async with engine.connect() as conn:
+        return await pending_versions(conn)
+
 
 async def init_db() -> None:
+    pending = await check_schema()
+    if not pending:
+        return
+
+    if not settings.DB_MIGRATE_ON_STARTUP:
+        raise RuntimeError(
+            f"Database schema is missing migrations {pending}. "
+            "Run 'python migrate.py' before starting the workers."
+        )
+
+    logger.warning("Applying migrations %s at startup", pending)
     await init_tables()
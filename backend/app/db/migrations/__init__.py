@@ -0,0 +1,83 @@
+"""Versioned schema migrations.
+
+Each module in ``app.db.migrations.versions`` exposes ``version``,
+``description`` and an ``upgrade(conn)`` coroutine. Applied versions are
+recorded in ``schema_migrations``; ``run_migrations`` applies the missing ones
+in order, in one transaction, under an advisory lock so that several workers
+starting at once do not race. Every statement is idempotent, so databases
+created by ``create_all`` (which already has the model-level indexes) and
+older databases converge on the same schema.
+
+Workers only compare ``pending_versions`` against the recorded versions at
+startup; DDL runs from the one-shot ``migrate.py`` command.
+"""
+
+# Built-in Dependencies
+from typing import List, Set
+
+# Third-Party Dependencies
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Local Dependencies
+from app.db.migrations.versions import MIGRATIONS
+
+SCHEMA_MIGRATIONS_TABLE = "schema_migrations"
+
+# Arbitrary key for pg_advisory_xact_lock, shared by every worker
+MIGRATION_LOCK_ID = 7_310_016
+
+
+def latest_version() -> int:
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+async def applied_versions(conn: AsyncConnection) -> Set[int]:
+    result = await conn.execute(
+        text("SELECT to_regclass(:table)"), {"table": SCHEMA_MIGRATIONS_TABLE}
+    )
+    if result.scalar() is None:
+        return set()
+
+    result = await conn.execute(text(f"SELECT version FROM {SCHEMA_MIGRATIONS_TABLE}"))
+    return set(result.scalars().all())
+
+
+async def pending_versions(conn: AsyncConnection) -> List[int]:
+    applied = await applied_versions(conn)
+    return [migration.version for migration in MIGRATIONS if migration.version not in applied]
+
+
+async def lock_migrations(conn: AsyncConnection) -> None:
+    # Held until the transaction ends; re-acquiring it in the same session is a no-op
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+
+
+async def run_migrations(conn: AsyncConnection) -> List[int]:
+    await lock_migrations(conn)
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_MIGRATIONS_TABLE} ("
+            "version INTEGER PRIMARY KEY, "
+            "description TEXT NOT NULL, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        )
+    )
+
+    applied = await applied_versions(conn)
+    newly_applied = []
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+
+        await migration.upgrade(conn)
+        await conn.execute(
+            text(
+                f"INSERT INTO {SCHEMA_MIGRATIONS_TABLE} (version, description) "
+                "VALUES (:version, :description)"
+            ),
+            {"version": migration.version, "description": migration.description},
+        )
+        newly_applied.append(migration.version)
+
+    return newly_applied
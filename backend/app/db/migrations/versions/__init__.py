@@ -0,0 +1,15 @@
+# Local Dependencies
+from app.db.migrations.versions import (
+    v001_baseline_schema,
+    v002_query_shape_indexes,
+    v003_role_counters,
+    v004_unique_role_names,
+)
+
+# Applied in this order; a migration's version never changes once released
+MIGRATIONS = [
+    v001_baseline_schema,
+    v002_query_shape_indexes,
+    v003_role_counters,
+    v004_unique_role_names,
+]
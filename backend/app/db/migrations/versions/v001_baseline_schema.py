@@ -0,0 +1,112 @@
+"""Bring databases created before versioned migrations up to the current models.
+
+``create_all`` only creates missing tables, so columns and constraints added
+to existing tables since then have to be applied here: the token epoch on
+users and the unique organization and member names relied on by signup.
+Revocations still live in the old ``system_token_blacklist`` table are
+copied to ``system_token_revocation`` before it is dropped, so tokens logged
+out before the upgrade stay revoked.
+"""
+
+# Third-Party Dependencies
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Local Dependencies
+from app.core.config import settings
+from app.core.cache import token_digest
+from app.db.models.auth import TokenBlacklist
+
+version = 1
+description = "token epoch column, unique organization and member names, revocation backfill"
+
+LEGACY_REVOCATION_TABLE = "system_token_blacklist"
+
+# Conflicting names listed when a unique constraint cannot be added
+MAX_REPORTED_DUPLICATES = 20
+
+
+def _add_unique_constraint(table: str, column: str) -> str:
+    # Same name PostgreSQL gives the inline constraint emitted by create_all
+    constraint = f"{table}_{column}_key"
+    return f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{constraint}') THEN
+                ALTER TABLE "{table}" ADD CONSTRAINT "{constraint}" UNIQUE ("{column}");
+            END IF;
+        END $$
+    """
+
+
+async def _check_duplicates(conn: AsyncConnection, table: str, column: str) -> None:
+    # Merging organizations or members is not safe to do automatically, so
+    # existing duplicates stop the migration with the names to resolve by hand
+    result = await conn.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :constraint"),
+        {"constraint": f"{table}_{column}_key"},
+    )
+    if result.scalar() is not None:
+        return
+
+    result = await conn.execute(
+        text(
+            f'SELECT "{column}", count(*) FROM "{table}" '
+            f'GROUP BY "{column}" HAVING count(*) > 1 '
+            f'ORDER BY count(*) DESC, "{column}" LIMIT {MAX_REPORTED_DUPLICATES + 1}'
+        )
+    )
+    duplicates = result.all()
+    if duplicates:
+        listed = ", ".join(
+            f"{name!r} ({count} rows)" for name, count in duplicates[:MAX_REPORTED_DUPLICATES]
+        )
+        more = " and more" if len(duplicates) > MAX_REPORTED_DUPLICATES else ""
+        raise RuntimeError(
+            f'Cannot add UNIQUE ("{column}") to "{table}": duplicate values {listed}{more}. '
+            "Rename or delete the duplicate rows, then run migrate.py again."
+        )
+
+
+async def _backfill_revocations(conn: AsyncConnection) -> None:
+    result = await conn.execute(
+        text("SELECT to_regclass(:table)"), {"table": LEGACY_REVOCATION_TABLE}
+    )
+    if result.scalar() is None:
+        return
+
+    result = await conn.execute(
+        text(f'SELECT token FROM "{LEGACY_REVOCATION_TABLE}" WHERE expires_at > now()')
+    )
+    tokens = list(result.scalars().all())
+    if tokens:
+        # Legacy tokens have no jti; token_identifier falls back to this digest,
+        # which PostgreSQL cannot compute (blake2b), so it is computed here
+        await conn.execute(
+            text(
+                f'INSERT INTO "{TokenBlacklist.__tablename__}" (jti, expires_at) '
+                f'SELECT d.jti, b.expires_at FROM "{LEGACY_REVOCATION_TABLE}" b '
+                "JOIN unnest(CAST(:tokens AS text[]), CAST(:jtis AS text[])) AS d(token, jti) "
+                "ON d.token = b.token "
+                "WHERE b.expires_at > now() "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"tokens": tokens, "jtis": [token_digest(token) for token in tokens]},
+        )
+    await conn.execute(text(f'DROP TABLE "{LEGACY_REVOCATION_TABLE}"'))
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    await conn.execute(
+        text(
+            f'ALTER TABLE "{settings.DATABASE_USER_TABLE}" '
+            "ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0"
+        )
+    )
+    for table, column in (
+        (settings.DATABASE_ORGANIZATION_TABLE, "organizationName"),
+        (settings.DATABASE_MEMBER_TABLE, "memberName"),
+    ):
+        await _check_duplicates(conn, table, column)
+        await conn.execute(text(_add_unique_constraint(table, column)))
+    await _backfill_revocations(conn)
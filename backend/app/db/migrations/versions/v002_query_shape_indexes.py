@@ -0,0 +1,53 @@
+"""Indexes matching the filters the CRUD layer actually issues.
+
+Equality lookups on ``email``, ``organizationName``, ``memberName`` and the
+primary keys are already served by their unique indexes. What remained were
+sequential scans on:
+
+* members by ``user_id`` (rich token claims; active rows only),
+* members and roles by organization, and members by ``role_id`` (foreign keys,
+  also needed so deleting a parent row does not scan the child table),
+* roles by ``roleName`` (``get_role``; active rows only),
+* users by ``user_role`` (``/user/count-by-role``),
+* keyset pages ordered by ``(created_at, id)``: unfiltered for users and
+  organizations, per organization for members and roles. Without these,
+  every page sorts all matching rows.
+
+``benchmarks/explain_query_shapes.py`` checks each shape against a live
+database. The indexes are built without CONCURRENTLY because migrations run
+inside a transaction; on a large existing table, create them concurrently
+by hand first and this migration becomes a no-op.
+"""
+
+# Third-Party Dependencies
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Local Dependencies
+from app.core.config import settings
+
+version = 2
+description = "composite and partial indexes for CRUD query shapes"
+
+member = settings.DATABASE_MEMBER_TABLE
+organization = settings.DATABASE_ORGANIZATION_TABLE
+role = settings.DATABASE_ROLE_TABLE
+user = settings.DATABASE_USER_TABLE
+
+STATEMENTS = [
+    f'CREATE INDEX IF NOT EXISTS "ix_{member}_org_id_memberName" ON "{member}" (org_id, "memberName")',
+    f'CREATE INDEX IF NOT EXISTS "ix_{member}_user_id_active" ON "{member}" (user_id) WHERE is_deleted = false',
+    f'CREATE INDEX IF NOT EXISTS "ix_{member}_role_id" ON "{member}" (role_id)',
+    f'CREATE INDEX IF NOT EXISTS "ix_{role}_org_id_roleName" ON "{role}" (org_id, "roleName")',
+    f'CREATE INDEX IF NOT EXISTS "ix_{role}_roleName_active" ON "{role}" ("roleName") WHERE is_deleted = false',
+    f'CREATE INDEX IF NOT EXISTS "ix_{user}_user_role" ON "{user}" (user_role)',
+    f'CREATE INDEX IF NOT EXISTS "ix_{user}_created_at_id" ON "{user}" (created_at, id)',
+    f'CREATE INDEX IF NOT EXISTS "ix_{organization}_created_at_id" ON "{organization}" (created_at, id)',
+    f'CREATE INDEX IF NOT EXISTS "ix_{member}_org_id_created_at_id" ON "{member}" (org_id, created_at, id)',
+    f'CREATE INDEX IF NOT EXISTS "ix_{role}_org_id_created_at_id" ON "{role}" (org_id, created_at, id)',
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
@@ -0,0 +1,154 @@
+"""Per-(organization, role) user counters maintained by triggers.
+
+``system_role_counts`` holds one row per ``(org_id, user_role)``: active
+members of the organization whose user has the role, plus rows under the
+nil UUID counting all active users. Row triggers on the user and member
+tables keep it current in the writing transaction, which covers every write
+path (CRUD methods, bulk COPY and the signup CTE alike). The triggers are
+created before the backfill; creating them locks out concurrent writes
+until this transaction commits, so no change can be missed.
+
+Each row has a single maintainer. Only the member trigger counts new and
+removed memberships, and only the user trigger counts the all-users rows.
+The signup CTE inserts the user and the member in one statement, and each
+trigger sees the other's row, so two maintainers would count every signup
+twice. The user trigger touches per-organization rows only when an existing
+user's role or deletion changes, which the member trigger cannot see. The
+all-users rows are split into ``ROLE_COUNT_SHARDS`` shards picked by user
+id, so concurrent signups do not queue on one row lock. Readers sum the
+shards.
+"""
+
+# Third-Party Dependencies
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Local Dependencies
+from app.core.config import settings
+from app.db.models.counter import ALL_ORGANIZATIONS, ROLE_COUNT_SHARDS
+
+version = 3
+description = "trigger-maintained role counters"
+
+member = settings.DATABASE_MEMBER_TABLE
+user = settings.DATABASE_USER_TABLE
+all_organizations = f"'{ALL_ORGANIZATIONS}'::uuid"
+
+
+def shard_of(user_id: str) -> str:
+    # Stable per user, so a user's decrement lands on the shard of its increment
+    return f"(abs(hashtext({user_id}::text)) % {ROLE_COUNT_SHARDS})::smallint"
+
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS system_role_counts (
+        org_id UUID NOT NULL,
+        user_role INTEGER NOT NULL,
+        shard SMALLINT NOT NULL DEFAULT 0,
+        total BIGINT NOT NULL DEFAULT 0,
+        PRIMARY KEY (org_id, user_role, shard)
+    )
+    """,
+    "DROP FUNCTION IF EXISTS system_bump_role_count(UUID, INTEGER, BIGINT)",
+    """
+    CREATE OR REPLACE FUNCTION system_bump_role_count(
+        p_org_id UUID, p_user_role INTEGER, p_delta BIGINT, p_shard SMALLINT DEFAULT 0
+    ) RETURNS void AS $$
+    BEGIN
+        INSERT INTO system_role_counts AS c (org_id, user_role, shard, total)
+        VALUES (p_org_id, p_user_role, p_shard, p_delta)
+        ON CONFLICT (org_id, user_role, shard) DO UPDATE SET total = c.total + EXCLUDED.total;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION system_count_user_roles() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted THEN
+            PERFORM system_bump_role_count({all_organizations}, OLD.user_role, -1, {shard_of("OLD.id")});
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_deleted THEN
+            PERFORM system_bump_role_count({all_organizations}, NEW.user_role, 1, {shard_of("NEW.id")});
+        END IF;
+        -- New memberships are counted by the member trigger; here only changes
+        -- to an existing user's role or deletion move its organizations' counts
+        IF TG_OP = 'UPDATE' THEN
+            IF NOT OLD.is_deleted THEN
+                PERFORM system_bump_role_count(m.org_id, OLD.user_role, -1)
+                    FROM "{member}" m WHERE m.user_id = OLD.id AND NOT m.is_deleted;
+            END IF;
+            IF NOT NEW.is_deleted THEN
+                PERFORM system_bump_role_count(m.org_id, NEW.user_role, 1)
+                    FROM "{member}" m WHERE m.user_id = NEW.id AND NOT m.is_deleted;
+            END IF;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION system_count_member_roles() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted THEN
+            PERFORM system_bump_role_count(OLD.org_id, u.user_role, -1)
+                FROM "{user}" u WHERE u.id = OLD.user_id AND NOT u.is_deleted;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_deleted THEN
+            PERFORM system_bump_role_count(NEW.org_id, u.user_role, 1)
+                FROM "{user}" u WHERE u.id = NEW.user_id AND NOT u.is_deleted;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f'DROP TRIGGER IF EXISTS system_count_user_roles_write ON "{user}"',
+    f"""
+    CREATE TRIGGER system_count_user_roles_write
+        AFTER INSERT OR DELETE ON "{user}"
+        FOR EACH ROW EXECUTE FUNCTION system_count_user_roles()
+    """,
+    f'DROP TRIGGER IF EXISTS system_count_user_roles_update ON "{user}"',
+    f"""
+    CREATE TRIGGER system_count_user_roles_update
+        AFTER UPDATE OF user_role, is_deleted ON "{user}"
+        FOR EACH ROW
+        WHEN (OLD.user_role IS DISTINCT FROM NEW.user_role OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted)
+        EXECUTE FUNCTION system_count_user_roles()
+    """,
+    f'DROP TRIGGER IF EXISTS system_count_member_roles_write ON "{member}"',
+    f"""
+    CREATE TRIGGER system_count_member_roles_write
+        AFTER INSERT OR DELETE ON "{member}"
+        FOR EACH ROW EXECUTE FUNCTION system_count_member_roles()
+    """,
+    f'DROP TRIGGER IF EXISTS system_count_member_roles_update ON "{member}"',
+    f"""
+    CREATE TRIGGER system_count_member_roles_update
+        AFTER UPDATE OF org_id, user_id, is_deleted ON "{member}"
+        FOR EACH ROW
+        WHEN (
+            OLD.org_id IS DISTINCT FROM NEW.org_id
+            OR OLD.user_id IS DISTINCT FROM NEW.user_id
+            OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted
+        )
+        EXECUTE FUNCTION system_count_member_roles()
+    """,
+    "DELETE FROM system_role_counts",
+    f"""
+    INSERT INTO system_role_counts (org_id, user_role, shard, total)
+    SELECT {all_organizations}, u.user_role, {shard_of("u.id")}, count(*)
+        FROM "{user}" u WHERE NOT u.is_deleted
+        GROUP BY u.user_role, 3
+    UNION ALL
+    SELECT m.org_id, u.user_role, 0::smallint, count(*)
+        FROM "{member}" m JOIN "{user}" u ON u.id = m.user_id
+        WHERE NOT m.is_deleted AND NOT u.is_deleted
+        GROUP BY m.org_id, u.user_role
+    """,
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
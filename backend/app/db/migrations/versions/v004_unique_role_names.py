@@ -0,0 +1,55 @@
+"""One role per name and organization.
+
+Concurrent owner checks could insert the same role twice. Duplicates are
+folded into the oldest active row (members are repointed to it) before the
+unique ``(org_id, roleName)`` constraint is added; it replaces the plain
+index from v002, which it makes redundant.
+"""
+
+# Third-Party Dependencies
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Local Dependencies
+from app.core.config import settings
+
+version = 4
+description = "unique (org_id, roleName)"
+
+member = settings.DATABASE_MEMBER_TABLE
+role = settings.DATABASE_ROLE_TABLE
+constraint = f"uq_{role}_org_id_roleName"
+
+duplicates = f"""
+    SELECT id, first_value(id) OVER (
+        PARTITION BY org_id, "roleName" ORDER BY is_deleted, created_at, id
+    ) AS keeper
+    FROM "{role}"
+"""
+
+STATEMENTS = [
+    f"""
+    UPDATE "{member}" m SET role_id = d.keeper
+    FROM ({duplicates}) d
+    WHERE m.role_id = d.id AND d.id <> d.keeper
+    """,
+    f"""
+    DELETE FROM "{role}" r
+    USING ({duplicates}) d
+    WHERE r.id = d.id AND d.id <> d.keeper
+    """,
+    f"""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{constraint}') THEN
+            ALTER TABLE "{role}" ADD CONSTRAINT "{constraint}" UNIQUE (org_id, "roleName");
+        END IF;
+    END $$
+    """,
+    f'DROP INDEX IF EXISTS "ix_{role}_org_id_roleName"',
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
@@ -2,10 +2,11 @@
 from datetime import datetime
 
 # Third-Party Dependencies
-from pydantic import Field
+from sqlmodel import Field, DateTime
+from sqlalchemy import CHAR
 
 # Local Dependencies
-from app.db.models.common import TimestampMixin, UUIDMixin, Base
+from app.db.models.common import Base
 
 
 class LoginInput(Base):
@@ -14,18 +15,23 @@ class LoginInput(Base):
 
 class TokenBlacklistBase(Base):
     # Data Columns
-    token: str = Field(
-        index=True,
+    jti: str = Field(
+        primary_key=True,
+        sa_type=CHAR(32),
         nullable=False,
         default=None,
-        description="Token value for authentication",
+        description="Fixed-width identifier (jti) of the revoked token",
     )
     expires_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        index=True,
         nullable=False,
         default=None,
         description="Timestamp indicating the expiration date and time of the token",
     )
 
 
-class TokenBlacklist(TokenBlacklistBase, UUIDMixin, TimestampMixin, table=True):
-    __tablename__ = "system_token_blacklist"
+# Rows are only needed until the token would have expired anyway; see
+# ``purge_expired_revocations``
+class TokenBlacklist(TokenBlacklistBase, table=True):
+    __tablename__ = "system_token_revocation"
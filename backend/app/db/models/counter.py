@@ -0,0 +1,41 @@
+# Built-in Dependencies
+from uuid import UUID
+
+# Third-Party Dependencies
+from sqlmodel import Field
+from sqlalchemy import BigInteger, SmallInteger
+
+# Local Dependencies
+from app.db.models.common import Base
+
+# ``org_id`` of the rows counting every active user, regardless of membership
+ALL_ORGANIZATIONS = UUID(int=0)
+
+# Rows per role under ALL_ORGANIZATIONS, so concurrent user writes do not
+# serialize on one row lock; per-organization counts use shard 0 only
+ROLE_COUNT_SHARDS = 16
+
+
+# Maintained by database triggers in the same transaction as user and member
+# writes; see app/db/migrations/versions/v003_role_counters.py
+class RoleCount(Base, table=True):
+    __tablename__ = "system_role_counts"
+
+    # Data Columns
+    org_id: UUID = Field(
+        primary_key=True,
+        description="Organization counted, or ALL_ORGANIZATIONS for all users",
+    )
+    user_role: int = Field(primary_key=True, description="Access level counted")
+    shard: int = Field(
+        default=0,
+        primary_key=True,
+        sa_type=SmallInteger,
+        description="Counter shard; the count is the sum over all shards",
+    )
+    total: int = Field(
+        default=0,
+        sa_type=BigInteger,
+        nullable=False,
+        description="Active users (or active members of the organization) with the role",
+    )
@@ -4,6 +4,7 @@ from typing import Optional
 
 # Third-Party Dependencies
 from sqlmodel import Field, Column, JSON
+from sqlalchemy import Index, text
 from pydantic import EmailStr
 
 # Local Dependencies
@@ -31,7 +32,7 @@ class MemberInfoBase(Base):
     )
     memberStatus: int = Field(default=0, nullable=False)
     memberSettings: Optional[dict] = Field(default=None, sa_column=Column(JSON, nullable=True))
-    memberName: str
+    memberName: str = Field(unique=True, nullable=False)
 
 class Member(
     MemberInfoBase,
@@ -40,4 +41,17 @@ class Member(
     SoftDeleteMixin,
     table=True,
 ):
-    __tablename__ = f"{settings.DATABASE_MEMBER_TABLE}"
\ No newline at end of file
+    __tablename__ = f"{settings.DATABASE_MEMBER_TABLE}"
+    # Mirrored by app/db/migrations/versions/v002_query_shape_indexes.py
+    __table_args__ = (
+        Index(f"ix_{settings.DATABASE_MEMBER_TABLE}_org_id_memberName", "org_id", "memberName"),
+        Index(
+            f"ix_{settings.DATABASE_MEMBER_TABLE}_user_id_active",
+            "user_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(f"ix_{settings.DATABASE_MEMBER_TABLE}_role_id", "role_id"),
+        Index(
+            f"ix_{settings.DATABASE_MEMBER_TABLE}_org_id_created_at_id", "org_id", "created_at", "id"
+        ),
+    )
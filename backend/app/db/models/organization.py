@@ -4,6 +4,7 @@ from typing import Optional
 
 # Third-Party Dependencies
 from sqlmodel import Field, Column, JSON
+from sqlalchemy import Index
 
 # Local Dependencies
 from app.db.models.common import (
@@ -17,7 +18,7 @@ from app.core.config import settings
 
 
 class OrganizationInfoBase(Base):
-    organizationName: str = Field(nullable=False)
+    organizationName: str = Field(unique=True, nullable=False)
     organizationStatus: int = Field(default=0, nullable=False)
     organizationPersonal: Optional[bool] = False
     organizationSettings: Optional[dict] = Field(default=None, sa_column=Column(JSON, nullable=True))
@@ -29,4 +30,8 @@ class Organization(
     SoftDeleteMixin,
     table=True,
 ):
-    __tablename__ = f"{settings.DATABASE_ORGANIZATION_TABLE}"
\ No newline at end of file
+    __tablename__ = f"{settings.DATABASE_ORGANIZATION_TABLE}"
+    # Mirrored by app/db/migrations/versions/v002_query_shape_indexes.py
+    __table_args__ = (
+        Index(f"ix_{settings.DATABASE_ORGANIZATION_TABLE}_created_at_id", "created_at", "id"),
+    )
\ No newline at end of file
@@ -3,6 +3,7 @@ from uuid import UUID
 
 # Third-Party Dependencies
 from sqlmodel import Field
+from sqlalchemy import Index, UniqueConstraint, text
 
 # Local Dependencies
 from app.db.models.common import (
@@ -30,4 +31,19 @@ class Role(
     SoftDeleteMixin,
     table=True,
 ):
-    __tablename__ = f"{settings.DATABASE_ROLE_TABLE}"
\ No newline at end of file
+    __tablename__ = f"{settings.DATABASE_ROLE_TABLE}"
+    # Mirrored by app/db/migrations/versions/v002_query_shape_indexes.py and
+    # v004_unique_role_names.py
+    __table_args__ = (
+        UniqueConstraint(
+            "org_id", "roleName", name=f"uq_{settings.DATABASE_ROLE_TABLE}_org_id_roleName"
+        ),
+        Index(
+            f"ix_{settings.DATABASE_ROLE_TABLE}_roleName_active",
+            "roleName",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            f"ix_{settings.DATABASE_ROLE_TABLE}_org_id_created_at_id", "org_id", "created_at", "id"
+        ),
+    )
@@ -4,6 +4,7 @@ from typing import Optional
 
 # Third-Party Dependencies
 from sqlmodel import Field, Column, JSON
+from sqlalchemy import Index
 from enum import IntEnum
 
 # Local Dependencies
@@ -28,6 +29,12 @@ class UserSecurityBase(Base):
     hashed_password: str = Field(
         nullable=False, description="Hashed password for user authentication"
     )
+    token_version: int = Field(
+        default=0,
+        nullable=False,
+        sa_column_kwargs={"server_default": "0"},
+        description="Epoch embedded in issued tokens; bumping it revokes all sessions",
+    )
 
 class AccessLevelBase(IntEnum):
     GUEST_USER: int                 = 0
@@ -69,3 +76,9 @@ class User(
     table=True,
 ):
     __tablename__ = f"{settings.DATABASE_USER_TABLE}"
+    # Mirrored by app/db/migrations/versions/v002_query_shape_indexes.py
+    __table_args__ = (
+        Index(f"ix_{settings.DATABASE_USER_TABLE}_user_role", "user_role"),
+        Index(f"ix_{settings.DATABASE_USER_TABLE}_created_at_id", "created_at", "id"),
+    )
+
@@ -0,0 +1,101 @@
+# Built-in Dependencies
+from typing import Any, Dict, Optional
+from uuid import uuid4
+import time
+
+# Third-Party Dependencies
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+# Local Dependencies
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Counters for sizing the connection pool of one worker."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.connects = 0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_checkout(self, wait: float, overflowed: bool) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if overflowed:
+            self.overflow_events += 1
+
+    def stats(self, pool: Any) -> Dict[str, Any]:
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "overflow_events": self.overflow_events,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (self.total_wait / self.checkouts * 1000) if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that times how long checkouts wait for a connection."""
+
+    # A class attribute, so pools recreated by ``dispose()`` keep their counters
+    metrics = pool_metrics
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        overflow = self._overflow
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+
+        # _overflow counts up from -pool_size as connections are opened
+        self.metrics.record_checkout(
+            time.perf_counter() - start, overflowed=self._overflow > max(overflow, 0)
+        )
+        return entry
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        self.metrics.connects += 1
+        return super()._create_connection()
+
+
+def engine_options(metrics: Optional[PoolMetrics] = None) -> Dict[str, Any]:
+    connect_args: Dict[str, Any] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DB_PGBOUNCER_MODE:
+        # Transaction pooling hands each statement to any server connection, so
+        # prepared statements must be neither cached nor reused by name
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    poolclass = InstrumentedAsyncQueuePool
+    if metrics is not None:
+        # Separate counters, e.g. for a replica engine
+        poolclass = type("InstrumentedAsyncQueuePool", (InstrumentedAsyncQueuePool,), {"metrics": metrics})
+
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
@@ -0,0 +1,109 @@
+# Built-in Dependencies
+from typing import Any, Dict, List, Optional
+import asyncio
+import itertools
+import logging
+
+# Third-Party Dependencies
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.engine import make_url
+
+# Local Dependencies
+from app.core.config import settings
+from app.db.pool import PoolMetrics, engine_options
+
+# Logger instance
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, or 0 when nothing is pending
+LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+class Replica:
+    def __init__(self, uri: str) -> None:
+        self.name = make_url(uri).render_as_string(hide_password=True)
+        self.metrics = PoolMetrics()
+        self.engine: AsyncEngine = create_async_engine(
+            uri, echo=False, future=True, **engine_options(metrics=self.metrics)
+        )
+        # Unhealthy until the first lag check succeeds
+        self.healthy = False
+        self.lag: Optional[float] = None
+
+
+class ReplicaRouter:
+    """Round-robin choice among replicas whose replication lag is acceptable.
+
+    ``check`` measures every replica's lag; one that errors or falls more
+    than ``max_lag`` seconds behind is skipped until a later check, and with
+    no healthy replica reads go to the primary.
+    """
+
+    def __init__(self, uris: List[str], max_lag: float) -> None:
+        self.max_lag = max_lag
+        self.replicas = [Replica(uri) for uri in uris]
+        self._cycle = itertools.cycle(self.replicas)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if replica.healthy:
+                return replica.engine
+        return None
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as conn:
+                result = await conn.exec_driver_sql(LAG_QUERY)
+                replica.lag = float(result.scalar())
+        except Exception as e:
+            if replica.healthy:
+                logger.warning("Replica %s unavailable: %s", replica.name, e)
+            replica.healthy, replica.lag = False, None
+            return
+
+        healthy = replica.lag <= self.max_lag
+        if healthy != replica.healthy:
+            logger.warning(
+                "Replica %s %s (lag %.1fs)",
+                replica.name, "back in rotation" if healthy else "lagging", replica.lag,
+            )
+        replica.healthy = healthy
+
+    async def check(self) -> None:
+        await asyncio.gather(*[self._check(replica) for replica in self.replicas])
+
+    async def monitor(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.check()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag,
+                "pool": replica.metrics.stats(replica.engine.pool),
+            }
+            for replica in self.replicas
+        ]
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+replica_router = ReplicaRouter(
+    uris=[uri.strip() for uri in settings.DB_REPLICA_URIS.split(",") if uri.strip()],
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
@@ -5,7 +5,7 @@ from app.db.models.auth import TokenBlacklistBase
 from app.utils.partial import optional
 from app.db.models.user import UserInfoBase, UserRoleBase
 from app.db.models.organization import OrganizationInfoBase
-from typing import Annotated
+from typing import Annotated, List, Optional
 
 # Third-Party Dependencies
 from pydantic import BaseModel, Field, ConfigDict
@@ -35,8 +35,31 @@ class Token(BaseModel):
     token_type: str
 
 
-class TokenData(BaseModel):
+class TokenClaims(BaseModel):
+    # Authorization claims embedded in "rich claims" access tokens
+    user_id: Optional[str] = None
+    org_id: Optional[str] = None
+    role_id: Optional[str] = None
+    user_role: Optional[int] = None
+
+
+class TokenData(TokenClaims):
     email: str
+    exp: Optional[int] = None
+    ver: int = 0
+
+
+class TokenIntrospectionBatch(BaseModel):
+    tokens: List[str]
+
+
+class TokenIntrospection(BaseModel):
+    active: bool
+    claims: Optional[TokenData] = None
+
+
+class TokenIntrospectionBatchResult(BaseModel):
+    results: List[TokenIntrospection]
 
 
 class TokenBlacklistCreate(TokenBlacklistBase):
@@ -1,20 +1,153 @@
+# Built-in Dependencies
+from typing import Any, AsyncGenerator, Awaitable, Callable, Union
+import asyncio
+import inspect
+
+# Third-Party Dependencies
+from sqlmodel import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
+# Local Dependencies
 from app.core.config import settings
+from app.db.pool import engine_options
+from app.db.replicas import replica_router
+
+# Keys used in ``AsyncSession.info`` to coordinate a unit of work
+UNIT_OF_WORK = "unit_of_work"
+AFTER_COMMIT = "after_commit"
+# Tables written by the session's open transaction; cached reads of them are skipped
+WRITTEN_TABLES = "written_tables"
+# Set once the session has written (or must see the latest data): reads stay on the primary
+USE_PRIMARY = "use_primary"
+# Replica engine the session's reads are pinned to
+REPLICA = "replica"
+
+
+async_engine = create_async_engine(
+    settings.POSTGRES_ASYNC_URI, echo=False, future=True, **engine_options()
+)
+
+class RoutingSession(Session):
+    """Sends plain SELECTs to a read replica and everything else to the primary.
+
+    After the session's first write, or ``use_primary``, its reads go to the
+    primary too, so a request always reads its own writes.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if self.info.get(USE_PRIMARY) or not replica_router.enabled:
+            return async_engine.sync_engine
 
+        is_read = (
+            clause is not None
+            and getattr(clause, "is_select", False)
+            and getattr(clause, "_for_update_arg", None) is None
+            and not self._flushing
+        )
+        if not is_read:
+            if self._flushing or getattr(clause, "is_dml", False):
+                self.info[USE_PRIMARY] = True
+            return async_engine.sync_engine
+
+        # One replica per session, so its reads share a connection and snapshot
+        if REPLICA not in self.info:
+            replica = replica_router.choose()
+            self.info[REPLICA] = replica.sync_engine if replica is not None else None
+        return self.info[REPLICA] or async_engine.sync_engine
 
-async_engine = create_async_engine(settings.POSTGRES_ASYNC_URI, echo=False, future=True)
 
 local_session = sessionmaker(
-    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
 )
 
 
-async def async_get_db() -> AsyncSession:
+def use_primary(db: AsyncSession) -> None:
+    # For reads that must not lag, and writes that look like SELECTs (data-modifying CTEs)
+    db.info[USE_PRIMARY] = True
+
+
+def read_from_primary(db: AsyncSession) -> bool:
+    # Whether the session's reads so far went to the primary (no replica, or none healthy)
+    return (
+        bool(db.info.get(USE_PRIMARY))
+        or not replica_router.enabled
+        or (REPLICA in db.info and db.info[REPLICA] is None)
+    )
+
+
+async def warm_up_pool(connections: int) -> int:
+    # Open the connections concurrently and hold them all, so each is a new one
+    connections = min(connections, settings.DB_POOL_SIZE)
+    if connections <= 0:
+        return 0
+
+    opened = await asyncio.gather(
+        *[async_engine.connect() for _ in range(connections)], return_exceptions=True
+    )
+    for connection in opened:
+        if not isinstance(connection, BaseException):
+            await connection.close()
+
+    failures = [connection for connection in opened if isinstance(connection, BaseException)]
+    if failures:
+        raise failures[0]
+    return connections
+
+
+async def commit(db: AsyncSession) -> None:
+    # In unit-of-work mode writes are only flushed; async_get_db commits once
+    if db.info.get(UNIT_OF_WORK):
+        await db.flush()
+    else:
+        await db.commit()
+
+
+def call_after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    # Cache invalidations must not run before the change is visible to others
+    if db.info.get(UNIT_OF_WORK):
+        db.info.setdefault(AFTER_COMMIT, []).append(callback)
+    else:
+        callback()
+
+
+async def await_after_commit(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    # Async counterpart of call_after_commit, e.g. for a networked cache
+    if db.info.get(UNIT_OF_WORK):
+        db.info.setdefault(AFTER_COMMIT, []).append(callback)
+    else:
+        await callback()
+
+
+async def _run_after_commit(db: AsyncSession) -> None:
+    for callback in db.info.pop(AFTER_COMMIT, []):
+        result: Union[None, Awaitable[None]] = callback()
+        if inspect.isawaitable(result):
+            await result
+
+
+async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
     async_session = local_session
 
     async with async_session() as db:
+        db.info[UNIT_OF_WORK] = settings.DB_UNIT_OF_WORK
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        db.info.pop(WRITTEN_TABLES, None)
+        await _run_after_commit(db)
+
+
+async def async_get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    # Read-only routes never commit; the transaction is rolled back on close
+    async with local_session() as db:
         yield db
-        await db.commit()
@@ -0,0 +1,56 @@
+# Built-in Dependencies
+from typing import Iterable, Iterator
+import hashlib
+import math
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter over strings.
+
+    ``might_contain`` never returns a false negative; false positives happen
+    at roughly ``error_rate`` once ``capacity`` items have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[str], capacity: int, error_rate: float = 0.01
+    ) -> "BloomFilter":
+        items = list(items)
+        bloom = cls(capacity=max(capacity, 2 * len(items)), error_rate=error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Kirsch-Mitzenmacher double hashing: k positions from one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain(item)
+
+    def __len__(self) -> int:
+        return self.count
@@ -1,11 +1,10 @@
 # Built-in Dependencies
-from typing import Any, Callable, Optional, Type, TypeVar, List, Tuple
-from copy import deepcopy
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, List, Tuple
+from copy import copy
 
 # Third-Party Dependencies
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
-from pydantic import BaseModel
 
 # https://github.com/pydantic/pydantic/issues/1223
 # https://github.com/pydantic/pydantic/pull/3179
@@ -14,6 +13,37 @@ from pydantic import BaseModel
 
 Model = TypeVar("Model", bound=Type[BaseModel])
 
+# Partial models already built, by source model and excluded fields
+_partial_models: Dict[Tuple[Type[BaseModel], Tuple[str, ...]], Type[BaseModel]] = {}
+
+
+def _make_field_optional(field: FieldInfo, default: Any = None) -> Tuple[Any, FieldInfo]:
+    # Shallow copy plus the two containers pydantic updates in place, instead
+    # of deep-copying every constraint and example
+    new = copy(field)
+    new.metadata = list(field.metadata)
+    new._attributes_set = dict(field._attributes_set)
+    new.default = default
+    new.annotation = Optional[field.annotation]
+    return new.annotation, new
+
+
+def partial_model(model: Type[Model], without_fields: Tuple[str, ...] = ()) -> Type[Model]:
+    key = (model, without_fields)
+    partial = _partial_models.get(key)
+    if partial is None:
+        partial = _partial_models[key] = create_model(
+            model.__name__,
+            __base__=BaseModel if without_fields else model,
+            __module__=model.__module__,
+            **{
+                field_name: _make_field_optional(field_info)
+                for field_name, field_info in model.model_fields.items()
+                if field_name not in without_fields
+            },
+        )
+    return partial
+
 
 def optional(without_fields: List[str] = None) -> Callable[[Model], Model]:
     """A decorator that create a partial model.
@@ -24,32 +54,9 @@ def optional(without_fields: List[str] = None) -> Callable[[Model], Model]:
     Returns:
         Type[BaseModel]: ModelBase partial model.
     """
-    if without_fields is None:
-        without_fields = []
+    excluded = tuple(without_fields or ())
 
     def wrapper(model: Type[Model]) -> Type[Model]:
-        base_model: Type[Model] = model
-
-        def make_field_optional(
-            field: FieldInfo, default: Any = None
-        ) -> Tuple[Any, FieldInfo]:
-            new = deepcopy(field)
-            new.default = default
-            new.annotation = Optional[field.annotation]
-            return new.annotation, new
-
-        if without_fields:
-            base_model = BaseModel
-
-        return create_model(
-            model.__name__,
-            __base__=base_model,
-            __module__=model.__module__,
-            **{
-                field_name: make_field_optional(field_info)
-                for field_name, field_info in model.model_fields.items()
-                if field_name not in without_fields
-            },
-        )
+        return partial_model(model, excluded)
 
     return wrapper
@@ -0,0 +1,97 @@
+"""Cold-start time of a worker: importing ``main`` and serving a first request.
+
+Each run starts a fresh interpreter, so nothing is shared with earlier runs.
+"import" is the time to ``import main``; "first request" is the time from
+spawning a single uvicorn worker until ``/health/db`` first answers 200,
+which covers imports, the schema check, pool warm-up and the other startup
+steps. ``--migrate`` also times the one-shot ``migrate.py`` on an up-to-date
+database. Needs a reachable database; run from the ``backend`` directory:
+
+    python benchmarks/bench_startup.py [runs] [--migrate]
+"""
+
+# Built-in Dependencies
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+# Third-Party Dependencies
+import httpx
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import main; print(time.perf_counter() - start)"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_import() -> float:
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_SNIPPET], cwd=BACKEND_DIR)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def time_command(*args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=BACKEND_DIR, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def time_first_request(timeout: float = 60.0) -> float:
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:start_application", "--factory",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0) as client:
+            while time.perf_counter() - start < timeout:
+                if server.poll() is not None:
+                    raise RuntimeError(f"Server exited with code {server.returncode}")
+                try:
+                    if client.get("/health/db").status_code == 200:
+                        return time.perf_counter() - start
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+        raise TimeoutError(f"No successful request within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def report(label: str, samples: list) -> None:
+    print(
+        f"{label:<15}: median {statistics.median(samples) * 1000:8.1f} ms, "
+        f"min {min(samples) * 1000:8.1f} ms, max {max(samples) * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure worker cold-start time.")
+    parser.add_argument("runs", type=int, nargs="?", default=5)
+    parser.add_argument("--migrate", action="store_true", help="also time migrate.py")
+    args = parser.parse_args()
+
+    if args.migrate:
+        # The first run may apply migrations; time only the no-op runs after it
+        time_command("migrate.py")
+        report("migrate.py", [time_command("migrate.py") for _ in range(args.runs)])
+
+    report("import main", [time_import() for _ in range(args.runs)])
+    report("first request", [time_first_request() for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
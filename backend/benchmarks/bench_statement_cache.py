@@ -0,0 +1,52 @@
+"""Python-side cost of building a ``crud_users.get(email=...)`` statement.
+
+Compares the previous per-call construction (column scan, ``filter_by`` and
+SQLAlchemy cache-key generation on a fresh statement) with the cached,
+parametrized statement used by ``CRUDBase`` now. No database is needed.
+Run from the ``backend`` directory:
+
+    python benchmarks/bench_statement_cache.py [iterations]
+"""
+
+# Built-in Dependencies
+import os
+import sys
+import timeit
+
+# Third-Party Dependencies
+from sqlmodel import select
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Local Dependencies
+from app.db.crud.crud_helper import _bound_filter_params
+from app.db.crud.crud_user import crud_users
+from app.db.models.user import User
+from app.db.schemas.v1.schema_user import UserRead
+
+
+def uncached() -> None:
+    to_select = [
+        getattr(User, name) for name in UserRead.model_fields.keys() if hasattr(User, name)
+    ]
+    stmt = select(*to_select).filter_by(email="bench@example.com", is_deleted=False)
+    stmt._generate_cache_key()
+
+
+def cached() -> None:
+    kwargs = {"email": "bench@example.com", "is_deleted": False}
+    stmt = crud_users._cached_statement("get", UserRead, kwargs)
+    _bound_filter_params(kwargs)
+    stmt._generate_cache_key()
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cached()
+
+    uncached_us = timeit.timeit(uncached, number=iterations) / iterations * 1e6
+    cached_us = timeit.timeit(cached, number=iterations) / iterations * 1e6
+
+    print(f"per-call construction : {uncached_us:8.2f} us/lookup")
+    print(f"cached statement      : {cached_us:8.2f} us/lookup")
+    print(f"speedup               : {uncached_us / cached_us:8.2f}x")
@@ -0,0 +1,140 @@
+"""Check that every CRUD query shape can be answered from an index.
+
+Builds the statements the CRUD layer issues (through the same statement cache
+``CRUDBase.get``/``exists`` use), runs ``EXPLAIN`` on each with sequential
+scans disabled, and fails if any plan still reads a table sequentially, i.e.
+if no index can serve the filter, or if a keyset page still sorts its rows.
+``tests/test_query_shapes.py`` runs the same checks. Needs a migrated
+database; the transaction is rolled back. Run from the ``backend`` directory:
+
+    python benchmarks/explain_query_shapes.py
+"""
+
+# Built-in Dependencies
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+from uuid import uuid4
+import asyncio
+import json
+import os
+import sys
+
+# Third-Party Dependencies
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import Select
+from sqlmodel import select
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Local Dependencies
+from app.db.crud.crud_auth import crud_token_blacklist
+from app.db.crud.crud_helper import _bound_filter_params
+from app.db.crud.crud_member import crud_member
+from app.db.crud.crud_organization import crud_organization
+from app.db.crud.crud_role import crud_role
+from app.db.crud.crud_user import crud_users
+from app.db.models.auth import TokenBlacklist
+from app.db.models.counter import RoleCount, ALL_ORGANIZATIONS
+from app.db.models.member import Member
+from app.db.models.organization import Organization
+from app.db.models.role import Role
+from app.db.models.user import User
+from app.db.session import async_engine
+
+
+def crud_shape(crud: Any, kind: str, schema_to_select: Any = None, **kwargs: Any) -> Tuple[Select, Dict[str, Any]]:
+    return crud._cached_statement(kind, schema_to_select, kwargs), _bound_filter_params(kwargs)
+
+
+# Keyset page as CRUDBase._paginate orders it
+def page(model: Any, *filters: Any) -> Tuple[Select, Dict[str, Any]]:
+    stmt = select(model.id).where(*filters).order_by(model.created_at, model.id).limit(101)
+    return stmt, {}
+
+
+def query_shapes() -> Dict[str, Tuple[Select, Dict[str, Any]]]:
+    org_id, user_id = uuid4(), uuid4()
+    return {
+        "user by email": crud_shape(crud_users, "get", "principal", email="a@example.com", is_deleted=False),
+        "user by id": crud_shape(crud_users, "get", None, id=user_id),
+        "users by role": (select(func.count()).select_from(User).where(User.user_role == 100), {}),
+        "role counters": (
+            select(func.sum(RoleCount.total)).where(
+                RoleCount.org_id == ALL_ORGANIZATIONS, RoleCount.user_role == 100
+            ),
+            {},
+        ),
+        "organization by name": crud_shape(
+            crud_organization, "get", None, organizationName="acme", is_deleted=False
+        ),
+        "role by name": crud_shape(crud_role, "get", None, roleName="owner", is_deleted=False),
+        "role by organization and name": crud_shape(
+            crud_role, "get", None, org_id=org_id, roleName="owner", is_deleted=False
+        ),
+        "member by name": crud_shape(crud_member, "exists", memberName="acme-owner"),
+        "member by user": crud_shape(
+            crud_member, "get", ["org_id", "role_id"], user_id=user_id, is_deleted=False
+        ),
+        "owner membership": crud_shape(
+            crud_member, "exists", user_id=user_id, org_id=org_id, role_id=uuid4(), is_deleted=False
+        ),
+        "members by organization": (select(Member.id).where(Member.org_id == org_id), {}),
+        # An organization has a handful of roles: sorting them after the unique
+        # (org_id, roleName) index is cheaper, so only index use is checked
+        "roles page by organization": page(Role, Role.org_id == org_id),
+        "revoked token": crud_shape(crud_token_blacklist, "exists", jti="0" * 32),
+        "expired revocations": (
+            select(TokenBlacklist.jti).where(TokenBlacklist.expires_at <= datetime.now(timezone.utc)),
+            {},
+        ),
+    }
+
+
+def page_shapes() -> Dict[str, Tuple[Select, Dict[str, Any]]]:
+    # Keyset pages that must be served in index order, without a sort
+    org_id = uuid4()
+    return {
+        "users page": page(User),
+        "organizations page": page(Organization),
+        "members page by organization": page(Member, Member.org_id == org_id),
+    }
+
+
+def plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def explain(conn: AsyncConnection, stmt: Select, params: Dict[str, Any]) -> List[str]:
+    # Values are inlined so the planner sees the same predicates a real call would
+    stmt = stmt.params(**params) if params else stmt
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [node["Node Type"] for node in plan_nodes(plan[0]["Plan"])]
+
+
+async def main() -> int:
+    failures = []
+    async with async_engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        shapes = [(name, shape, False) for name, shape in query_shapes().items()]
+        shapes += [(name, shape, True) for name, shape in page_shapes().items()]
+        for name, (stmt, params), ordered in shapes:
+            nodes = await explain(conn, stmt, params)
+            uses_index = "Seq Scan" not in nodes and not (ordered and "Sort" in nodes)
+            print(f"{'ok  ' if uses_index else 'FAIL'} {name:32} {' > '.join(nodes)}")
+            if not uses_index:
+                failures.append(name)
+        await conn.rollback()
+
+    await async_engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,104 @@
+"""Import-time profile of the app, from ``python -X importtime``.
+
+Imports a module (``main`` by default) in a fresh interpreter and prints the
+total import time, the slowest modules by cumulative time and the
+third-party packages by self time. Exits with 1 when a module that should be
+imported lazily was loaded, or when the total exceeds ``--budget-ms``, so it
+can gate CI; ``tests/test_import_time.py`` runs the same checks. Run from
+the ``backend`` directory:
+
+    python benchmarks/profile_imports.py [module] [--top N] [--budget-ms MS]
+"""
+
+# Built-in Dependencies
+from typing import Dict, List, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Loaded on first use only: hashing, token signing and the redis cache backend
+LAZY_MODULES = ("passlib", "bcrypt", "jose.jwk", "jose.jwt", "redis")
+
+
+def profile(code: str) -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for every module imported running ``code``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        # "import time:       123 |        456 |   package.module"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def by_package(entries: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    packages: Dict[str, int] = {}
+    for name, self_us, _ in entries:
+        package = name.split(".")[0]
+        if package != "app" and package not in sys.stdlib_module_names:
+            packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+
+def eager_modules(entries: List[Tuple[str, int, int]]) -> List[str]:
+    """The ``LAZY_MODULES`` that were imported anyway."""
+    imported = {name for name, _, _ in entries}
+    return [
+        lazy for lazy in LAZY_MODULES
+        if any(name == lazy or name.startswith(f"{lazy}.") for name in imported)
+    ]
+
+
+def import_profile(module: str) -> List[Tuple[str, int, int]]:
+    # Leave out what the interpreter imports at startup anyway (site, encodings, ...)
+    baseline = {name for name, _, _ in profile("pass")}
+    return [entry for entry in profile(f"import {module}") if entry[0] not in baseline]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile the import time of the app.")
+    parser.add_argument("module", nargs="?", default="main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    entries = import_profile(args.module)
+    # Self times do not overlap, so their sum is the whole import
+    total_us = sum(self_us for _, self_us, _ in entries)
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms, {len(entries)} modules\n")
+    print("slowest modules (cumulative ms):")
+    for name, _, cumulative_us in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}  {name}")
+
+    print("\nthird-party packages (self ms):")
+    packages = sorted(by_package(entries).items(), key=lambda p: p[1], reverse=True)
+    for package, self_us in packages[:args.top]:
+        print(f"  {self_us / 1000:8.1f}  {package}")
+
+    failed = False
+    eager = eager_modules(entries)
+    if eager:
+        print(f"\n[FAIL] imported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+        print(f"\n[FAIL] {total_us / 1000:.1f} ms exceeds the {args.budget_ms:.1f} ms budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
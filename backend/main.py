@@ -1,8 +1,9 @@
 import sys
 import os
+import asyncio
+from contextlib import asynccontextmanager
 
 import fastapi
-import uvicorn
 
 # Add the project directory to the sys.path
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
@@ -12,6 +13,18 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 from app.core.config import settings
 from app.db import init_db
 from app.apis.base import api_router
+from app.apis.forward_auth import verify_request
+from app.core.hashing import hashing_pool
+from app.core.keys import key_ring
+from app.core.shared_cache import shared_cache
+from app.core.invalidation import invalidation_bus
+from app.db.session import async_engine, warm_up_pool
+from app.db.replicas import replica_router
+from app.core.revocation import (
+    load_revocation_filter,
+    refresh_revocation_filter_periodically,
+    purge_expired_revocations_periodically,
+)
 
 description = """
 Auth Service for Multi tenant Saas
@@ -33,12 +46,69 @@ tags_metadata = [
 
 def include_router(app: fastapi.FastAPI):
     app.include_router(api_router)
+    # Gateway fast path, mounted outside the FastAPI dependency system
+    app.add_route(
+        "/auth/verify", verify_request, methods=["GET", "HEAD"], include_in_schema=False
+    )
+
 
 
+background_tasks: list[asyncio.Task] = []
+
 
 async def startup_event():
     print("Executing startup event")
+    # Parses the signing keys now, so a bad key fails the boot rather than a request
+    key_ring.load()
     await init_db.init_db()
+    await warm_up_pool(settings.DB_POOL_WARMUP)
+    if replica_router.enabled:
+        await replica_router.check()
+        background_tasks.append(
+            asyncio.create_task(replica_router.monitor(settings.DB_REPLICA_CHECK_SECONDS))
+        )
+    # Subscribed before the filter loads, so no revocation falls in between
+    await invalidation_bus.start()
+    await load_revocation_filter()
+    background_tasks.append(
+        asyncio.create_task(
+            refresh_revocation_filter_periodically(
+                settings.REVOCATION_FILTER_REFRESH_SECONDS
+            )
+        )
+    )
+    background_tasks.append(
+        asyncio.create_task(
+            purge_expired_revocations_periodically(
+                settings.REVOCATION_PURGE_INTERVAL_SECONDS,
+                settings.REVOCATION_PURGE_BATCH_SIZE,
+            )
+        )
+    )
+
+
+async def shutdown_event():
+    print("Executing shutdown event")
+    for task in background_tasks:
+        task.cancel()
+    background_tasks.clear()
+    await invalidation_bus.stop()
+    # Drain queued hashes without blocking the loop other shutdown steps run on
+    await asyncio.to_thread(hashing_pool.shutdown, True)
+    if shared_cache is not None:
+        await shared_cache.close()
+    await async_engine.dispose()
+    await replica_router.dispose()
+
+
+@asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    # Replaces add_event_handler("startup"/"shutdown"), removed in Starlette 1.0
+    await startup_event()
+    try:
+        yield
+    finally:
+        await shutdown_event()
 
 
 def start_application():
@@ -47,13 +117,16 @@ def start_application():
         version=settings.PROJECT_VERSION,
         description=description,
         contact={"name": settings.CONTACT_NAME, "email": settings.CONTACT_EMAIL},
+        lifespan=lifespan,
     )
     include_router(app)
-    app.add_event_handler("startup", startup_event)
     return app
 
 
 if __name__ == "__main__":
+    # Only needed here; uvicorn workers import it before this module
+    import uvicorn
+
     # app = start_application()
     try:
         print(f"[INFO] Starting Application at: host={settings.SERVER_IP}, port={settings.SERVER_PORT}")
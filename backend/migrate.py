@@ -0,0 +1,53 @@
+"""One-shot schema setup: creates missing tables and applies pending migrations.
+
+Run once per deploy, before the workers start (e.g. as a release step or an
+init container); workers then only check the schema version. Safe to run
+concurrently, the advisory lock serialises it. Run from the ``backend``
+directory:
+
+    python migrate.py [--check]
+"""
+
+# Built-in Dependencies
+import argparse
+import asyncio
+import os
+import sys
+
+# Add the project directory to the sys.path
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+# Local Dependencies
+from app.db.init_db import check_schema, init_tables
+from app.db.migrations import latest_version
+from app.db.session import async_engine
+
+
+async def run(check: bool) -> int:
+    try:
+        if check:
+            pending = await check_schema()
+            if pending:
+                print(f"[INFO] Pending migrations: {pending}")
+                return 1
+            print(f"[INFO] Schema is at version {latest_version()}")
+            return 0
+
+        applied = await init_tables()
+        print(f"[INFO] Applied migrations: {applied or 'none'}; schema is at version {latest_version()}")
+        return 0
+    finally:
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Create tables and apply pending migrations.")
+    parser.add_argument(
+        "--check", action="store_true", help="only report pending migrations; exit 1 if any"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.check)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Production entry point: multi-worker uvicorn without the autoreloader.
+
+Each worker is a separate process with its own event loop, connection pool
+and hashing pool, so size DB_POOL_SIZE and HASHING_POOL_WORKERS per worker.
+On SIGTERM/SIGINT uvicorn stops accepting connections, lets in-flight
+requests finish for up to SERVER_GRACEFUL_SHUTDOWN_SECONDS and then runs the
+application's shutdown handler (background tasks, hashing pool, database
+engines). Run from the ``backend`` directory:
+
+    python serve.py [--workers N] [--host HOST] [--port PORT]
+"""
+
+# Built-in Dependencies
+import argparse
+import importlib.util
+import os
+import sys
+
+# Third-Party Dependencies
+import uvicorn
+
+# Add the project directory to the sys.path
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+# Local Dependencies
+from app.core.config import settings
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the auth service in production mode.")
+    parser.add_argument("--host", default=settings.SERVER_IP)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS)
+    args = parser.parse_args()
+
+    # uvloop and httptools are C implementations of the loop and the HTTP parser
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    if loop != "uvloop" or http != "httptools":
+        print(f"[WARNING] uvloop/httptools not installed, falling back to loop={loop}, http={http}")
+
+    print(
+        f"[INFO] Starting Application at: host={args.host}, port={args.port}, "
+        f"workers={args.workers}, loop={loop}, http={http}"
+    )
+    uvicorn.run(
+        "main:start_application",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=loop,
+        http=http,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+        proxy_headers=settings.SERVER_PROXY_HEADERS,
+        access_log=settings.SERVER_ACCESS_LOG,
+        reload=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
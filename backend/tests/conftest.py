@@ -0,0 +1,72 @@
+"""Shared fixtures.
+
+Database tests run against the database the settings point at (``POSTGRES_*``
+from the environment or ``.env``), migrating it first, and are skipped when it
+is unreachable. Run from the ``backend`` directory:
+
+    python -m pytest tests
+"""
+
+# Built-in Dependencies
+from typing import Any, AsyncIterator, Callable, Dict
+from uuid import uuid4
+import os
+import sys
+
+# Third-Party Dependencies
+import fastapi
+import httpx
+import pytest
+import pytest_asyncio
+
+# Add the project directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Local Dependencies
+import main
+from app.db.init_db import init_tables
+from app.db.session import async_engine
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def database() -> AsyncIterator[None]:
+    try:
+        async with async_engine.connect():
+            pass
+    except Exception as e:
+        await async_engine.dispose()
+        pytest.skip(f"Database unreachable: {e}")
+    await init_tables()
+    yield
+    await async_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app(database: None) -> AsyncIterator[fastapi.FastAPI]:
+    app = main.start_application()
+    async with app.router.lifespan_context(app):
+        yield app
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(app: fastapi.FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def signup_payload() -> Callable[..., Dict[str, Any]]:
+    """Builds valid signup bodies with names no other test uses."""
+
+    def build(**overrides: Any) -> Dict[str, Any]:
+        suffix = uuid4().hex[:12]
+        return {
+            "email": f"user-{suffix}@example.com",
+            "password": "Str0ng!Passw0rd",
+            "organizationName": f"org-{suffix}",
+            "memberName": f"member-{suffix}",
+            **overrides,
+        }
+
+    return build
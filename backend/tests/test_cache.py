@@ -0,0 +1,39 @@
+# Local Dependencies
+from app.core.cache import TokenEpochCache
+
+
+def test_token_epoch_invalidate_by_id_after_lru_reorder():
+    cache = TokenEpochCache(maxsize=2, ttl=60)
+    cache.set("user-1", "one@example.com", 0)
+    cache.set("user-2", "two@example.com", 0)
+    # A hit moves user-1 to the most recently used end, so user-2 is evicted next
+    assert cache.get("one@example.com") == 0
+    cache.set("user-3", "three@example.com", 0)
+    assert cache.get("two@example.com") is None
+
+    cache.invalidate_user(id="user-1")
+
+    assert cache.get("one@example.com") is None
+    assert cache.get("three@example.com") == 0
+
+
+def test_token_epoch_invalidate_by_id_drops_previous_emails():
+    cache = TokenEpochCache(maxsize=10, ttl=60)
+    cache.set("user-1", "old@example.com", 1)
+    cache.set("user-1", "new@example.com", 1)
+
+    cache.invalidate_user(id=["user-1"])
+
+    assert cache.get("old@example.com") is None
+    assert cache.get("new@example.com") is None
+
+
+def test_token_epoch_index_rebuild_keeps_live_entries():
+    cache = TokenEpochCache(maxsize=2, ttl=60)
+    for n in range(10):
+        cache.set(f"user-{n}", f"{n}@example.com", n)
+
+    cache.invalidate_user(id="user-9")
+
+    assert cache.get("9@example.com") is None
+    assert cache.get("8@example.com") == 8
@@ -0,0 +1,29 @@
+# Built-in Dependencies
+import os
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from benchmarks.profile_imports import eager_modules, import_profile
+
+
+@pytest.fixture(scope="module")
+def main_imports():
+    return import_profile("main")
+
+
+def test_main_defers_lazy_modules(main_imports):
+    assert eager_modules(main_imports) == []
+
+
+@pytest.mark.skipif(
+    "IMPORT_TIME_BUDGET_MS" not in os.environ,
+    reason="machine dependent; set IMPORT_TIME_BUDGET_MS to enforce",
+)
+def test_main_import_time_within_budget(main_imports):
+    budget_ms = float(os.environ["IMPORT_TIME_BUDGET_MS"])
+    # Self times do not overlap, so their sum is the whole import
+    total_ms = sum(self_us for _, self_us, _ in main_imports) / 1000
+
+    assert total_ms <= budget_ms
@@ -0,0 +1,23 @@
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from app.core.config import settings
+from app.core.invalidation import LocalInvalidationBackend, build_invalidation_bus
+
+
+def test_postgres_bus_refuses_pgbouncer_mode(monkeypatch):
+    monkeypatch.setattr(settings, "INVALIDATION_BUS_BACKEND", "postgres")
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+
+    with pytest.raises(ValueError, match="DB_PGBOUNCER_MODE"):
+        build_invalidation_bus()
+
+
+def test_local_bus_works_with_pgbouncer_mode(monkeypatch):
+    monkeypatch.setattr(settings, "INVALIDATION_BUS_BACKEND", "local")
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+
+    bus = build_invalidation_bus()
+
+    assert isinstance(bus.backend, LocalInvalidationBackend)
@@ -0,0 +1,51 @@
+# Built-in Dependencies
+from uuid import UUID, uuid4
+
+# Third-Party Dependencies
+from jose import jwt
+import pytest
+
+# Local Dependencies
+from app.core.config import settings
+from app.db.crud.crud_member import crud_member
+from app.db.crud.crud_role import get_or_create_role_id
+from app.db.schemas.v1.schema_member import MemberCreateInternal
+from app.db.session import local_session
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _login_claims(client, payload):
+    response = await client.post(
+        "/auth/login", json={"email": payload["email"], "password": payload["password"]}
+    )
+    assert response.status_code == 200, response.text
+    return jwt.get_unverified_claims(response.json()["access_token"])
+
+
+async def test_rich_claims_only_name_a_single_membership(client, signup_payload, monkeypatch):
+    monkeypatch.setattr(settings, "RICH_CLAIMS_TOKENS", True)
+    alice_payload, bob_payload = signup_payload(), signup_payload()
+    alice = (await client.post("/users/signup", json=alice_payload)).json()
+    bob = (await client.post("/users/signup", json=bob_payload)).json()
+
+    claims = await _login_claims(client, alice_payload)
+    assert claims["org_id"] == alice["org_id"]
+    assert claims["role_id"] == alice["role_id"]
+
+    async with local_session() as db:
+        role_id = await get_or_create_role_id(db=db, org_id=UUID(bob["org_id"]), roleName="member")
+        await crud_member.create(
+            db=db,
+            object=MemberCreateInternal(
+                org_id=bob["org_id"],
+                user_id=alice["user_id"],
+                role_id=role_id,
+                memberName=f"member-{uuid4().hex[:12]}",
+            ),
+        )
+
+    claims = await _login_claims(client, alice_payload)
+    assert claims["user_id"] == alice["user_id"]
+    assert "org_id" not in claims
+    assert "role_id" not in claims
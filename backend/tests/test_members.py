@@ -0,0 +1,72 @@
+# Built-in Dependencies
+from uuid import UUID, uuid4
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from app.db.crud.crud_role import get_or_create_role_id
+from app.db.session import local_session
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _signup_and_login(client, signup_payload):
+    payload = signup_payload()
+    response = await client.post("/users/signup", json=payload)
+    assert response.status_code == 201, response.text
+    login = await client.post(
+        "/auth/login", json={"email": payload["email"], "password": payload["password"]}
+    )
+    assert login.status_code == 200, login.text
+    return response.json(), login.cookies["access_token"]
+
+
+async def _member_role_id(org_id: str) -> str:
+    async with local_session() as db:
+        return await get_or_create_role_id(db=db, org_id=UUID(org_id), roleName="member")
+
+
+async def _invite(client, access_token: str, org_id: str, user_id: str, role_id: str):
+    # Tokens are read from the cookie; the client keeps the one of the last login
+    client.cookies.set("access_token", access_token)
+    return await client.post(
+        "/members/invite-member",
+        json={
+            "org_id": org_id,
+            "user_id": user_id,
+            "role_id": role_id,
+            "memberName": f"member-{uuid4().hex[:12]}",
+        },
+    )
+
+
+async def test_invite_requires_ownership_of_the_target_organization(client, signup_payload):
+    alice, alice_token = await _signup_and_login(client, signup_payload)
+    bob, bob_token = await _signup_and_login(client, signup_payload)
+
+    # Alice also becomes a plain member of Bob's organization
+    bob_member_role = await _member_role_id(bob["org_id"])
+    response = await _invite(client, bob_token, bob["org_id"], alice["user_id"], bob_member_role)
+    assert response.status_code == 200, response.text
+
+    # Whichever membership a lookup would find first, ownership is per organization
+    alice_member_role = await _member_role_id(alice["org_id"])
+    response = await _invite(
+        client, alice_token, alice["org_id"], bob["user_id"], alice_member_role
+    )
+    assert response.status_code == 200, response.text
+
+    response = await _invite(client, alice_token, bob["org_id"], bob["user_id"], bob_member_role)
+    assert response.status_code == 403
+
+
+async def test_invite_without_membership_is_forbidden(client, signup_payload):
+    alice, alice_token = await _signup_and_login(client, signup_payload)
+    bob, _ = await _signup_and_login(client, signup_payload)
+
+    response = await _invite(
+        client, alice_token, bob["org_id"], alice["user_id"], bob["role_id"]
+    )
+
+    assert response.status_code == 403
@@ -0,0 +1,34 @@
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from app.db.session import async_engine
+from benchmarks.explain_query_shapes import explain, page_shapes, query_shapes
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+QUERY_SHAPES = query_shapes()
+PAGE_SHAPES = page_shapes()
+
+
+async def _plan(stmt, params):
+    async with async_engine.connect() as conn:
+        # Any sequential scan left in the plan is one no index can replace
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        nodes = await explain(conn, stmt, params)
+        await conn.rollback()
+    return nodes
+
+
+@pytest.mark.parametrize("name", list(QUERY_SHAPES))
+async def test_query_shape_uses_an_index(database, name):
+    nodes = await _plan(*QUERY_SHAPES[name])
+
+    assert "Seq Scan" not in nodes, f"{name}: {' > '.join(nodes)}"
+
+
+@pytest.mark.parametrize("name", list(PAGE_SHAPES))
+async def test_keyset_page_is_read_in_index_order(database, name):
+    nodes = await _plan(*PAGE_SHAPES[name])
+
+    assert "Seq Scan" not in nodes and "Sort" not in nodes, f"{name}: {' > '.join(nodes)}"
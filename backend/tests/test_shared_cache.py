@@ -0,0 +1,58 @@
+# Built-in Dependencies
+from uuid import uuid4
+
+# Third-Party Dependencies
+import pytest
+
+# Local Dependencies
+from app.core import shared_cache as shared_cache_module
+from app.core.shared_cache import MemoryCacheBackend, SharedCache
+from app.db.crud import base as crud_base
+from app.db.crud.crud_role import crud_role
+from app.db.replicas import replica_router
+from app.db.session import async_engine, local_session, use_primary
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+async def test_memory_backend_returns_copies():
+    backend = MemoryCacheBackend(maxsize=10)
+    row = {"id": uuid4(), "settings": {"theme": "dark"}}
+    await backend.set("role_data", 0, "key", row, ttl=60)
+
+    _, cached = await backend.get("role_data", "key")
+    cached["settings"]["theme"] = "light"
+    row["settings"]["theme"] = "light"
+
+    _, cached = await backend.get("role_data", "key")
+    assert cached == {"id": row["id"], "settings": {"theme": "dark"}}
+
+
+@pytest.fixture
+def memory_shared_cache(monkeypatch):
+    cache = SharedCache(backend=MemoryCacheBackend(maxsize=100), ttl=60, namespace_ttls={})
+    monkeypatch.setattr(shared_cache_module, "shared_cache", cache)
+    monkeypatch.setattr(crud_base, "shared_cache", cache)
+    return cache
+
+
+async def test_replica_reads_do_not_fill_the_shared_cache(
+    database, memory_shared_cache, monkeypatch
+):
+    # A "replica" that is really the primary, so the read itself succeeds
+    monkeypatch.setattr(replica_router, "replicas", [object()])
+    monkeypatch.setattr(replica_router, "choose", lambda: async_engine)
+    role_id = uuid4()
+
+    async with local_session() as db:
+        assert await crud_role.get(db=db, schema_to_select=["id"], id=role_id) is None
+    assert memory_shared_cache.stats()["role_data"]["sets"] == 0
+
+    async with local_session() as db:
+        use_primary(db)
+        assert await crud_role.get(db=db, schema_to_select=["id"], id=role_id) is None
+    assert memory_shared_cache.stats()["role_data"]["sets"] == 1
+
+    _, cached = await memory_shared_cache.get(
+        "role_data", crud_role._cache_key("get", ["id"], {"id": role_id})
+    )
+    assert cached is None
@@ -0,0 +1,58 @@
+# Third-Party Dependencies
+import pytest
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_signup_creates_owner_membership(client, signup_payload):
+    payload = signup_payload()
+
+    response = await client.post("/users/signup", json=payload)
+
+    assert response.status_code == 201, response.text
+    member = response.json()
+    assert member["memberName"] == payload["memberName"]
+    assert member["user_id"] and member["org_id"] and member["role_id"]
+
+    login = await client.post(
+        "/auth/login", json={"email": payload["email"], "password": payload["password"]}
+    )
+    assert login.status_code == 200, login.text
+    assert login.json()["token_type"] == "bearer"
+
+
+async def test_signup_duplicate_email(client, signup_payload):
+    first = signup_payload()
+    assert (await client.post("/users/signup", json=first)).status_code == 201
+
+    response = await client.post("/users/signup", json=signup_payload(email=first["email"]))
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Email is already registered"
+
+
+async def test_signup_duplicate_organization_rolls_back_user(client, signup_payload):
+    first = signup_payload()
+    assert (await client.post("/users/signup", json=first)).status_code == 201
+    retry = signup_payload(organizationName=first["organizationName"])
+
+    response = await client.post("/users/signup", json=retry)
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Organization name is already registered"
+    # The user inserted before the conflict was rolled back, so the email is still free
+    retry["organizationName"] = signup_payload()["organizationName"]
+    assert (await client.post("/users/signup", json=retry)).status_code == 201
+
+
+async def test_signup_duplicate_member_rolls_back_user_and_organization(client, signup_payload):
+    first = signup_payload()
+    assert (await client.post("/users/signup", json=first)).status_code == 201
+    retry = signup_payload(memberName=first["memberName"])
+
+    response = await client.post("/users/signup", json=retry)
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Member is already registered"
+    retry["memberName"] = signup_payload()["memberName"]
+    assert (await client.post("/users/signup", json=retry)).status_code == 201